@@ -1,7 +1,11 @@
 from __future__ import annotations
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import requests
 from datetime import datetime, timezone
-from census import Census
+
+ACS_ENDPOINT_TMPL = "https://api.census.gov/data/{year}/acs/acs5"
 
 ACS_FIELDS = [
     "NAME",
@@ -14,50 +18,67 @@ ACS_FIELDS = [
     "B15003_022E", "B15003_023E", "B15003_024E", "B15003_025E"
 ]
 
+# Hoisted so each call binds a module-level constant instead of
+# rebuilding the transform text / GET params per invocation.
+_ACS_GET_PARAM = ",".join(ACS_FIELDS)
+
+_ACS_TRANSFORM_SQL = """
+SELECT
+    LPAD(state, 2, '0') || LPAD(county, 3, '0') AS geoid,
+    NAME AS name,
+    TRY_CAST(B01003_001E AS DOUBLE) AS total_population,
+    TRY_CAST(B02001_002E AS DOUBLE) AS white,
+    TRY_CAST(B02001_003E AS DOUBLE) AS black,
+    TRY_CAST(B02001_005E AS DOUBLE) AS asian,
+    TRY_CAST(B02001_004E AS DOUBLE) AS native_american,
+    TRY_CAST(B02001_006E AS DOUBLE) AS pacific_islander,
+    TRY_CAST(B02001_007E AS DOUBLE) AS other_race,
+    TRY_CAST(B02001_008E AS DOUBLE) AS two_or_more,
+    TRY_CAST(B03003_003E AS DOUBLE) AS hispanic_latino,
+    TRY_CAST(B19013_001E AS DOUBLE) AS median_income,
+    TRY_CAST(B25077_001E AS DOUBLE) AS median_home_value,
+    TRY_CAST(B23025_005E AS DOUBLE) AS unemployed,
+    CAST(COALESCE(TRY_CAST(B15003_022E AS DOUBLE), 0)
+      + COALESCE(TRY_CAST(B15003_023E AS DOUBLE), 0)
+      + COALESCE(TRY_CAST(B15003_024E AS DOUBLE), 0)
+      + COALESCE(TRY_CAST(B15003_025E AS DOUBLE), 0) AS INTEGER) AS college_educated,
+    ? AS acs_year,
+    ? AS last_refresh_utc
+FROM raw
+"""
+
 def fetch_acs_county_all_states(census_key: str, year: int = 2022) -> pd.DataFrame:
-    c = Census(census_key)
-    rows = []
-    for state in range(1, 57):  # includes territories; we will filter later
-        sf = str(state).zfill(2)
-        try:
-            data = c.acs5.state_county(ACS_FIELDS, sf, "*", year=year)
-            if data:
-                rows.extend(data)
-        except Exception:
-            continue
-
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return df
-
-    df = df.rename(columns={
-        "B01003_001E": "total_population",
-        "B02001_002E": "white",
-        "B02001_003E": "black",
-        "B02001_004E": "native_american",
-        "B02001_005E": "asian",
-        "B02001_006E": "pacific_islander",
-        "B02001_007E": "other_race",
-        "B02001_008E": "two_or_more",
-        "B03003_003E": "hispanic_latino",
-        "B19013_001E": "median_income",
-        "B25077_001E": "median_home_value",
-        "B23025_005E": "unemployed",
-        "B15003_022E": "bachelor",
-        "B15003_023E": "master",
-        "B15003_024E": "professional",
-        "B15003_025E": "doctorate",
-    })
-
-    for col in ["total_population","white","black","native_american","asian","pacific_islander","other_race","two_or_more","hispanic_latino","median_income","median_home_value","unemployed","bachelor","master","professional","doctorate"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df["college_educated"] = df[["bachelor","master","professional","doctorate"]].fillna(0).sum(axis=1)
-    df["geoid"] = df["state"].astype(str).str.zfill(2) + df["county"].astype(str).str.zfill(3)
-    df["acs_year"] = year
-    df["last_refresh_utc"] = datetime.now(timezone.utc).replace(tzinfo=None)
-
-    keep = ["geoid","NAME","total_population","white","black","asian","native_american","pacific_islander","other_race","two_or_more","hispanic_latino","median_income","median_home_value","unemployed","college_educated","acs_year","last_refresh_utc"]
-    out = df[keep].copy().rename(columns={"NAME":"name"})
+    # Single national query (for=county:*): the API filters server-side
+    # and returns every county in one response, replacing 56 per-state
+    # round trips and their Python-side accumulation. Territories are
+    # included; we will filter later.
+    url = ACS_ENDPOINT_TMPL.format(year=year)
+    params = {"get": _ACS_GET_PARAM, "for": "county:*"}
+    if census_key:
+        params["key"] = census_key
+
+    resp = requests.get(url, params=params, timeout=60)
+    resp.raise_for_status()
+    data = resp.json()
+    if not data or len(data) < 2:
+        return pd.DataFrame()
+
+    # First row is the header; state/county FIPS come back as the
+    # trailing geography columns.
+    raw = pa.Table.from_pylist([dict(zip(data[0], row)) for row in data[1:]])
+    if raw.num_rows == 0:
+        return pd.DataFrame()
+
+    # One vectorized SQL pass does the renames, numeric coercion,
+    # college_educated sum, and GEOID construction, instead of ~20
+    # separate pandas ops each allocating a new frame.
+    con = duckdb.connect()
+    con.register("raw", raw)
+    out = con.execute(
+        _ACS_TRANSFORM_SQL,
+        [year, datetime.now(timezone.utc).replace(tzinfo=None)],
+    ).fetchdf()
+
+    out["geoid"] = out["geoid"].astype("category")
+    out["name"] = out["name"].astype("category")
     return out
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
 
 
 ACS_RENAME_MAP = {
@@ -29,13 +30,21 @@ ACS_RENAME_MAP = {
 }
 
 
+# Columns we know are counts, whether they arrive raw or already renamed.
+_NUMERIC_COLS = frozenset(ACS_RENAME_MAP) | frozenset(ACS_RENAME_MAP.values())
+
+
 def clean_numeric(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Converts columns that *look* numeric into numeric,
-    preserving None for blanks and non-numeric input.
+    Converts the known ACS count columns to numeric in a single pass,
+    preserving None for blanks and non-numeric input. Downcasts so we
+    get int32/float32 arrays instead of 64-bit defaults.
     """
-    for col in df.columns:
-        df[col] = pd.to_numeric(df[col], errors="ignore")
+    numeric_cols = [c for c in df.columns if c in _NUMERIC_COLS]
+    if numeric_cols:
+        df[numeric_cols] = df[numeric_cols].apply(
+            pd.to_numeric, errors="coerce", downcast="integer"
+        )
     return df
 
 
@@ -56,7 +65,7 @@ def load_raw_acs(filepath: str) -> pd.DataFrame:
     df = df.rename(columns=rename_cols)
 
     # Convert numeric columns
-    df = df.apply(pd.to_numeric, errors="ignore")
+    df = clean_numeric(df)
 
     print(f"ACS records loaded: {len(df)}")
     print(f"Renamed columns: {list(rename_cols.values())}")
@@ -72,10 +81,10 @@ def build_acs_table(con: duckdb.DuckDBPyConnection, df: pd.DataFrame) -> int:
 
     con.execute("DROP TABLE IF EXISTS acs_county")
 
-    con.execute(
-        "CREATE TABLE acs_county AS SELECT * FROM df",
-        {"df": df},
-    )
+    # Register as Arrow so numeric columns attach zero-copy.
+    con.register("_acs_df", pa.Table.from_pandas(df, preserve_index=False))
+    con.execute("CREATE TABLE acs_county AS SELECT * FROM _acs_df")
+    con.unregister("_acs_df")
 
     n = con.execute("SELECT COUNT(*) FROM acs_county").fetchone()[0]
     print(f"acs_county built. Rows: {n}")
@@ -85,9 +94,39 @@ def build_acs_table(con: duckdb.DuckDBPyConnection, df: pd.DataFrame) -> int:
 def refresh_acs_county(con: duckdb.DuckDBPyConnection, filepath: str) -> int:
     """
     Main entrypoint called from app.py
+
+    Loads the raw CSV straight into DuckDB (no intermediate DataFrame),
+    applies the canonical renames, and coerces the known count columns
+    to BIGINT in a single vectorized pass.
     """
-    df = load_raw_acs(filepath)
-    return build_acs_table(con, df)
+    print(f"Loading raw ACS file: {filepath}")
+
+    con.execute(
+        "CREATE OR REPLACE TABLE acs_county AS "
+        "SELECT * FROM read_csv_auto(?, ALL_VARCHAR=TRUE, SAMPLE_SIZE=-1)",
+        [filepath],
+    )
+
+    cols = [r[1] for r in con.execute("PRAGMA table_info('acs_county')").fetchall()]
+    renamed = []
+    for raw, new in ACS_RENAME_MAP.items():
+        if raw in cols:
+            con.execute(f'ALTER TABLE acs_county RENAME COLUMN "{raw}" TO "{new}"')
+            renamed.append(new)
+
+    if renamed:
+        cols = [ACS_RENAME_MAP.get(c, c) for c in cols]
+        select_exprs = ", ".join(
+            f'TRY_CAST("{c}" AS BIGINT) AS "{c}"' if c in renamed else f'"{c}"'
+            for c in cols
+        )
+        con.execute(f"CREATE OR REPLACE TABLE acs_county AS SELECT {select_exprs} FROM acs_county")
+
+    n = con.execute("SELECT COUNT(*) FROM acs_county").fetchone()[0]
+    print(f"ACS records loaded: {n}")
+    print(f"Renamed columns: {renamed}")
+    print(f"acs_county built. Rows: {n}")
+    return n
 
 
 if __name__ == "__main__":
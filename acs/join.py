@@ -1,20 +1,54 @@
 import os
+import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing import Optional
 
 from acs.schema import POP_ALIASES, MINORITY_SHARE_ALIASES, WHITE_NH_SHARE_ALIASES, NAME_ALIASES
 
-def _pick(df: pd.DataFrame, aliases):
-    for a in aliases:
-        if a in df.columns:
-            return a
-    return None
+_NON_DIGIT = re.compile(r"\D+")
+_NON_NUMERIC = re.compile(r"[^0-9.\-]+")
+
+def _pick(col_set: set, aliases):
+    return next((a for a in aliases if a in col_set), None)
+
+def _normalize_geoid(values: np.ndarray) -> np.ndarray:
+    # Single pass over the raw values into a fixed-width <U5 array,
+    # instead of three chained pandas str ops (each allocating a full
+    # object ndarray).
+    sub = _NON_DIGIT.sub
+    out = np.empty(len(values), dtype="<U5")
+    for i, v in enumerate(values):
+        if pd.isna(v):
+            digits = ""
+        else:
+            digits = sub("", v if isinstance(v, str) else str(v))
+        out[i] = digits[-5:].zfill(5)
+    return out
+
+def _parse_numeric(values: np.ndarray) -> np.ndarray:
+    # One pass per value with a compiled regex, instead of the
+    # astype(str)/str.replace/to_numeric chain (four Series allocations).
+    sub = _NON_NUMERIC.sub
+    out = np.full(len(values), np.nan, dtype=np.float64)
+    for i, v in enumerate(values):
+        if pd.isna(v):
+            continue
+        s = sub("", v if isinstance(v, str) else str(v))
+        try:
+            out[i] = float(s)
+        except ValueError:
+            pass
+    return out
 
 def load_acs_county(path: str) -> Optional[pd.DataFrame]:
     path = os.path.abspath(path)
     if not os.path.exists(path):
         return None
-    df = pd.read_csv(path, dtype=str, low_memory=False)
+    # pyarrow parser + backend: columns come back Arrow-typed, skipping
+    # the per-cell PyObject allocation of the object-dtype path.
+    df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow")
     # normalize GEOID
     if "GEOID" not in df.columns:
         # try alt
@@ -22,23 +56,33 @@ def load_acs_county(path: str) -> Optional[pd.DataFrame]:
             df = df.rename(columns={"geoid": "GEOID"})
     if "GEOID" not in df.columns:
         return None
-    df["GEOID"] = df["GEOID"].astype(str).str.replace(r"\D", "", regex=True).str.zfill(5).str[-5:]
+    df["GEOID"] = _normalize_geoid(df["GEOID"].to_numpy())
 
-    name_col = _pick(df, NAME_ALIASES)
-    pop_col  = _pick(df, POP_ALIASES)
-    min_col  = _pick(df, MINORITY_SHARE_ALIASES)
-    wnh_col  = _pick(df, WHITE_NH_SHARE_ALIASES)
+    col_set = set(df.columns)
+    name_col = _pick(col_set, NAME_ALIASES)
+    pop_col  = _pick(col_set, POP_ALIASES)
+    min_col  = _pick(col_set, MINORITY_SHARE_ALIASES)
+    wnh_col  = _pick(col_set, WHITE_NH_SHARE_ALIASES)
 
     out = pd.DataFrame({"GEOID": df["GEOID"]})
     if name_col:
         out["NAME"] = df[name_col]
     if pop_col:
-        out["population"] = pd.to_numeric(df[pop_col].astype(str).str.replace(r"[^0-9\.-]", "", regex=True), errors="coerce")
+        out["population"] = _parse_numeric(df[pop_col].to_numpy())
     if min_col:
-        out["minority_share"] = pd.to_numeric(df[min_col], errors="coerce")
+        # Shares live in [0,1]; float32 is plenty and halves scan width.
+        out["minority_share"] = pd.to_numeric(df[min_col], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
     elif wnh_col:
-        wnh = pd.to_numeric(df[wnh_col], errors="coerce")
-        out["minority_share"] = 1.0 - wnh
+        # Work on the raw ndarray so the subtraction is one numpy op
+        # rather than a pandas __rsub__ with index realignment.
+        wnh = pd.to_numeric(df[wnh_col], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+        out["minority_share"] = np.float32(1.0) - wnh
+
+    # Low-cardinality keys: dictionary-encode so joins hash integer
+    # codes instead of object strings (and Arrow round-trips zero-copy).
+    out["GEOID"] = out["GEOID"].astype("category")
+    if "NAME" in out.columns:
+        out["NAME"] = out["NAME"].astype("category")
 
     return out
 
@@ -47,33 +91,38 @@ def ensure_acs_table(con, acs_df: Optional[pd.DataFrame]) -> None:
     CREATE TABLE IF NOT EXISTS acs_county(
         GEOID VARCHAR PRIMARY KEY,
         NAME VARCHAR,
-        population BIGINT,
-        minority_share DOUBLE
+        population INTEGER,
+        minority_share REAL
     );
     """)
     if acs_df is None or acs_df.empty:
         return
-    # deterministic replace
-    con.execute("DELETE FROM acs_county")
-    con.register("acs_df", acs_df)
+    # Arrow registration is zero-copy for primitive columns; the pandas
+    # path would copy object/string columns into DuckDB vectors.
+    con.register("acs_df", pa.Table.from_pandas(acs_df, preserve_index=False))
+    # Deterministic replace via CTAS: one direct-path columnar write,
+    # instead of tombstoning every row with DELETE and re-inserting.
     con.execute("""
-        INSERT INTO acs_county
+        CREATE OR REPLACE TABLE acs_county AS
         SELECT
             GEOID,
             COALESCE(NAME, '') AS NAME,
-            CAST(population AS BIGINT) AS population,
-            CAST(minority_share AS DOUBLE) AS minority_share
+            CAST(population AS INTEGER) AS population,
+            CAST(minority_share AS REAL) AS minority_share
         FROM acs_df
     """)
+    con.unregister("acs_df")
+    # CTAS drops the original PRIMARY KEY; restore a unique index so
+    # the refresh_county_stats join probes an index instead of a full
+    # hash-build on every refresh.
+    con.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_acs_geoid ON acs_county(GEOID)")
 
 def refresh_county_stats(con) -> None:
-    # Ensure county_stats exists (created by ppp.schema)
-    # Replace contents deterministically
-    con.execute("DELETE FROM county_stats")
-
-    # Join ppp_agg to acs_county when available
+    # Replace contents deterministically: CTAS writes the joined result
+    # in one pass instead of DELETE + INSERT against the existing table
+    # (created by ppp.schema).
     con.execute("""
-    INSERT INTO county_stats
+    CREATE OR REPLACE TABLE county_stats AS
     SELECT
         a.GEOID,
         COALESCE(b.NAME, '') AS NAME,
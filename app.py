@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import weakref
 from pathlib import Path
 import duckdb
 import streamlit as st
@@ -33,21 +34,53 @@ def _is_streamlit_cloud() -> bool:
 # DuckDB Bootstrap
 # =============================================================================
 
-def _open_duckdb() -> duckdb.DuckDBPyConnection:
+def _db_path() -> Path:
     """
-    Open DuckDB in read-only mode for analytics.
+    Resolve the DuckDB file path (env override, else repo-relative default).
     """
-    # Default DB path (repo-relative)
     default_db = Path("data/db/v_finder.duckdb")
+    return Path(os.environ.get("V_FINDER_DB", default_db))
+
+
+@st.cache_resource(show_spinner=False)
+def _open_duckdb() -> duckdb.DuckDBPyConnection:
+    """
+    Open DuckDB in read-only mode for analytics.
 
-    # Allow override via env var (Cloud-safe)
-    db_path = Path(os.environ.get("V_FINDER_DB", default_db))
+    Cached for the lifetime of the process so reruns reuse the same
+    connection (and its compat views) instead of re-parsing the catalog.
+    """
+    db_path = _db_path()
 
     if not db_path.exists():
         st.error(f"DuckDB file not found: {db_path}")
         st.stop()
 
-    return duckdb.connect(str(db_path), read_only=True)
+    con = duckdb.connect(str(db_path), read_only=True)
+    _ensure_compat_views(con)
+    return con
+
+
+@st.cache_data(ttl=300)
+def _table_catalog(db_mtime: float) -> set[tuple[str, str]]:
+    """
+    One-shot snapshot of (schema, table) pairs in the DB.
+
+    Keyed by the DB file's mtime so schema changes invalidate the cache;
+    steady-state reruns never touch information_schema. Opens its own
+    read-only connection because DuckDBPyConnection is unhashable.
+    """
+    con = duckdb.connect(str(_db_path()), read_only=True)
+    try:
+        rows = con.execute(
+            "SELECT lower(table_schema), lower(table_name) FROM information_schema.tables"
+        ).fetchall()
+    finally:
+        con.close()
+    return {(s, t) for s, t in rows}
+
+
+_COMPAT_VIEWS_DONE: "weakref.WeakSet[duckdb.DuckDBPyConnection]" = weakref.WeakSet()
 
 
 def _ensure_compat_views(con: duckdb.DuckDBPyConnection) -> None:
@@ -65,36 +98,22 @@ def _ensure_compat_views(con: duckdb.DuckDBPyConnection) -> None:
       - core.*
     """
 
+    # Idempotent across reruns on a cached connection. Weakly held so a
+    # closed connection's entry dies with it instead of lingering on a
+    # reusable id().
+    if con in _COMPAT_VIEWS_DONE:
+        return
+
+    try:
+        catalog = _table_catalog(_db_path().stat().st_mtime)
+    except Exception:
+        catalog = set()
+
     def has_table(schema: str, name: str) -> bool:
-        try:
-            return bool(
-                con.execute(
-                    """
-                    SELECT COUNT(*)
-                    FROM information_schema.tables
-                    WHERE lower(table_schema) = lower(?)
-                      AND lower(table_name) = lower(?)
-                    """,
-                    [schema, name],
-                ).fetchone()[0]
-            )
-        except Exception:
-            return False
+        return (schema.lower(), name.lower()) in catalog
 
     def has_any(name: str) -> bool:
-        try:
-            return bool(
-                con.execute(
-                    """
-                    SELECT COUNT(*)
-                    FROM information_schema.tables
-                    WHERE lower(table_name) = lower(?)
-                    """,
-                    [name],
-                ).fetchone()[0]
-            )
-        except Exception:
-            return False
+        return any(t == name.lower() for _, t in catalog)
 
     mappings = [
         ("county_scores", "analytics"),
@@ -103,29 +122,38 @@ def _ensure_compat_views(con: duckdb.DuckDBPyConnection) -> None:
         ("county_ref", "core"),
     ]
 
-    for table, schema in mappings:
-        # If already accessible unqualified, do nothing
-        if has_any(table):
-            continue
+    stmts = [
+        f"CREATE VIEW {table} AS SELECT * FROM {schema}.{table}"
+        for table, schema in mappings
+        if not has_any(table) and has_table(schema, table)
+    ]
 
-        # If schema-qualified table exists, create compat view
-        if has_table(schema, table):
+    if stmts:
+        # One multi-statement transaction: a single catalog write instead
+        # of one per view.
+        try:
+            con.execute("BEGIN; " + "; ".join(stmts) + "; COMMIT;")
+        except Exception:
+            # Views may already exist or be created concurrently; ignore
             try:
-                con.execute(
-                    f"CREATE VIEW {table} AS SELECT * FROM {schema}.{table}"
-                )
+                con.execute("ROLLBACK")
             except Exception:
-                # View may already exist or be created concurrently; ignore
                 pass
 
+    _COMPAT_VIEWS_DONE.add(con)
+
 
 # =============================================================================
 # UI Imports (AFTER BOOTSTRAP)
 # =============================================================================
 
+@st.cache_resource(show_spinner=False)
 def _import_pages():
     """
     Import UI modules only after DuckDB + compat views are ready.
+
+    Cached so reruns reuse the page registry instead of re-running the
+    import machinery on every interaction.
     """
     from ui.dashboard import render_dashboard_page
     from ui.mission_control import render_mission_control_page
@@ -176,7 +204,6 @@ def main() -> None:
     # Open DB + bootstrap
     # -------------------------------------------------------------------------
     con = _open_duckdb()
-    _ensure_compat_views(con)
 
     # -------------------------------------------------------------------------
     # Header
@@ -1,6 +1,7 @@
 import requests
 import pandas as pd
 import os
+from requests.adapters import HTTPAdapter
 
 # =====================================================
 # CONFIG
@@ -14,14 +15,20 @@ os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
 # =====================================================
 # ACS API HELPERS
 # =====================================================
-def fetch_acs(table, variables):
+def _make_session():
+    # Pooled HTTPS connections: one TLS handshake reused across fetches.
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return s
+
+def fetch_acs(session, table, variables):
     base = f"https://api.census.gov/data/{YEAR}/acs/acs5"
     params = {
         "get": ",".join(variables),
         "for": "county:*",
         "key": API_KEY
     }
-    r = requests.get(base, params=params)
+    r = session.get(base, params=params)
     r.raise_for_status()
     data = r.json()
     df = pd.DataFrame(data[1:], columns=data[0])
@@ -54,34 +61,21 @@ EMP_VARS = [
     "B23025_005E",  # unemployed
 ]
 
+# Single combined request — the Census API takes up to 50 variables per
+# GET, so one call covers all four tables.
+ALL_VARS = POP_VARS + INC_VARS + POV_VARS + EMP_VARS
+
 # =====================================================
 # FETCH
 # =====================================================
 print("\n=== Fetching ACS 2023 5-year data from Census API ===")
 
-print("• Population (B01001)…")
-pop = fetch_acs("B01001", POP_VARS)
-
-print("• Income (B19013)…")
-inc = fetch_acs("B19013", INC_VARS)
-
-print("• Poverty (B17001)…")
-pov = fetch_acs("B17001", POV_VARS)
-
-print("• Employment (B23025)…")
-emp = fetch_acs("B23025", EMP_VARS)
+print("• Population / Income / Poverty / Employment (single request)…")
+df = fetch_acs(_make_session(), "combined", ALL_VARS)
 
-# =====================================================
-# MERGE
-# =====================================================
-
-df = pop.copy()
+# All variables arrive aligned in one frame, so no merges are needed.
 df["GEOID"] = df["state"] + df["county"]
 
-df = df.merge(inc, on=["state", "county"])
-df = df.merge(pov, on=["state", "county"])
-df = df.merge(emp, on=["state", "county"])
-
 # =====================================================
 # CLEAN + RENAME
 # =====================================================
@@ -95,13 +89,13 @@ df = df.rename(columns={
     "B23025_005E": "Unemployed",
 })
 
-# convert numerics
-for col in [
+# convert numerics in one pass (avoids per-column block inserts)
+NUM_COLS = [
     "Total_Pop", "Median_Income",
     "Poverty_Universe", "Poverty_Count",
     "Labor_Force", "Unemployed"
-]:
-    df[col] = pd.to_numeric(df[col], errors="coerce")
+]
+df[NUM_COLS] = df[NUM_COLS].apply(pd.to_numeric, errors="coerce")
 
 df["Poverty_Rate"] = df["Poverty_Count"] / df["Poverty_Universe"]
 df["Unemployment_Rate"] = df["Unemployed"] / df["Labor_Force"]
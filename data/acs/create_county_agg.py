@@ -2,8 +2,46 @@ import duckdb
 
 DB = "data/db/v_finder.duckdb"
 
-def create_county_agg():
+
+def _ingest_watermark(con) -> str:
+    """
+    Fingerprint of ppp_ingest_log: changes whenever new PPP chunks land.
+    """
+    try:
+        row = con.execute(
+            "SELECT COUNT(*), COALESCE(SUM(row_count), 0) "
+            "FROM ppp_ingest_log WHERE status = 'OK'"
+        ).fetchone()
+        return f"{row[0]}:{row[1]}"
+    except duckdb.Error:
+        return "no-log"
+
+
+def _stored_watermark(con) -> str | None:
+    con.execute(
+        "CREATE TABLE IF NOT EXISTS mv_state("
+        "mv_name VARCHAR PRIMARY KEY, watermark VARCHAR)"
+    )
+    row = con.execute(
+        "SELECT watermark FROM mv_state WHERE mv_name = 'county_agg'"
+    ).fetchone()
+    return row[0] if row else None
+
+
+def create_county_agg(force: bool = False):
     con = duckdb.connect(DB)
+
+    # Skip the full rescan of ppp_clean when nothing has been ingested
+    # since the last build (watermark from ppp_ingest_log).
+    watermark = _ingest_watermark(con)
+    stored = _stored_watermark(con)
+    has_agg = con.execute(
+        "SELECT 1 FROM duckdb_tables WHERE table_name = 'county_agg' LIMIT 1"
+    ).fetchone() is not None
+    if not force and has_agg and stored == watermark:
+        print("county_agg is up to date (no new PPP ingests); skipping rebuild.")
+        return
+
     print("Building county_agg using PPP + ACS + county_ref...")
 
     con.execute("DROP TABLE IF EXISTS county_agg")
@@ -12,15 +50,16 @@ def create_county_agg():
         CREATE TABLE county_agg AS
         WITH p AS (
             SELECT
+                borrowerstate_u,
                 county_norm,
                 COUNT(*)::BIGINT AS ppp_loan_count,
                 SUM(CAST(currentapprovalamount AS DOUBLE)) AS ppp_current_total
             FROM ppp_clean
-            GROUP BY county_norm
+            GROUP BY borrowerstate_u, county_norm
         ),
         a AS (
             SELECT
-                GEOID,
+                GEOID_I32,
                 CAST(Total_Pop AS BIGINT) AS Total_Pop,
                 CAST(Median_Income AS DOUBLE) AS Median_Income,
                 CAST(Poverty_Rate AS DOUBLE) AS Poverty_Rate,
@@ -29,8 +68,10 @@ def create_county_agg():
         )
         SELECT
             r.GEOID,
+            r.GEOID_I32,
             r.STUSPS,
             r.NAME AS NAME,
+            r.NAME_NORM,
             a.Total_Pop,
             a.Median_Income,
             a.Poverty_Rate,
@@ -40,12 +81,32 @@ def create_county_agg():
             CASE
                 WHEN a.Total_Pop > 0 THEN COALESCE(p.ppp_current_total,0)/a.Total_Pop
                 ELSE 0
-            END AS ppp_per_capita
+            END AS ppp_per_capita,
+            -- basic fraud risk scoring model, computed in the same pass
+            -- (county_scores is now just a projection of this table)
+            (
+                (a.Poverty_Rate * 0.3) +
+                (a.Unemployment_Rate * 0.3) +
+                (CASE
+                    WHEN a.Total_Pop > 0 THEN COALESCE(p.ppp_current_total,0)/a.Total_Pop
+                    ELSE 0
+                END * 0.4)
+            ) AS fraud_score
         FROM county_ref r
-        LEFT JOIN a ON a.GEOID = r.GEOID
-        LEFT JOIN p ON LOWER(p.county_norm) = LOWER(r.NAME)
+        -- 4-byte integer key: scalar-hash fast path instead of
+        -- variable-length string equality (string GEOID kept for display)
+        LEFT JOIN a ON a.GEOID_I32 = r.GEOID_I32
+        -- county_norm and NAME_NORM are both normalized uppercase at
+        -- write time, so this is a raw equi-join (no per-row LOWER), and
+        -- the state key disambiguates same-named counties across states.
+        LEFT JOIN p ON p.county_norm = r.NAME_NORM
+                   AND p.borrowerstate_u = r.STUSPS
     """)
 
+    con.execute(
+        "INSERT OR REPLACE INTO mv_state VALUES ('county_agg', ?)", [watermark]
+    )
+
     print("county_agg built successfully.")
 
 
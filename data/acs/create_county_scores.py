@@ -7,12 +7,23 @@ def create_county_scores():
 
     print("Building county_scores...")
 
-    con.execute("DROP TABLE IF EXISTS county_scores")
+    # fraud_score is computed during the county_agg build, so
+    # county_scores is a zero-cost projection over it. A previous run
+    # (or the scoring engine) may have left either a table or a view
+    # behind; IF EXISTS does not cover a type mismatch, so pick the
+    # DROP statement from the catalog, then replace so re-runs never
+    # keep a stale definition.
+    is_view = con.execute(
+        "SELECT COUNT(*) FROM duckdb_views() "
+        "WHERE NOT internal AND lower(view_name) = 'county_scores'"
+    ).fetchone()[0]
+    con.execute(f"DROP {'VIEW' if is_view else 'TABLE'} IF EXISTS county_scores")
 
     con.execute("""
-        CREATE TABLE county_scores AS
+        CREATE OR REPLACE VIEW county_scores AS
         SELECT
             GEOID,
+            GEOID_I32,
             STUSPS,
             NAME,
             Total_Pop,
@@ -21,12 +32,7 @@ def create_county_scores():
             ppp_loan_count,
             ppp_current_total,
             ppp_per_capita,
-            -- basic fraud risk scoring model
-            (
-                (Poverty_Rate * 0.3) +
-                (Unemployment_Rate * 0.3) +
-                (ppp_per_capita * 0.4)
-            ) AS fraud_score
+            fraud_score
         FROM county_agg
     """)
 
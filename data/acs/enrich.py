@@ -43,6 +43,7 @@ from typing import Any, Dict, Optional
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
 import requests
 
 # Default year if UI does not specify
@@ -74,7 +75,9 @@ def _ensure_cache_dir() -> None:
 
 
 def _cache_path(year: int) -> str:
-    return os.path.join(ACS_CACHE_DIR, f"acs_{year}.csv")
+    # Parquet preserves dtypes (no re-coercion on load) and reads far
+    # faster than CSV.
+    return os.path.join(ACS_CACHE_DIR, f"acs_{year}.parquet")
 
 
 # ---------------------------------------------------------------------------
@@ -121,72 +124,68 @@ def _fetch_acs_from_api(year: int, api_key: Optional[str]) -> pd.DataFrame:
     return df
 
 
-def _canonicalize_acs_df(df: pd.DataFrame) -> pd.DataFrame:
+def _canonicalize_in_duckdb(
+    con: duckdb.DuckDBPyConnection, df_raw: pd.DataFrame
+) -> pd.DataFrame:
     """
-    Convert raw ACS DF into canonical schema with stable names.
-    Expects columns: NAME, <ACS VAR KEYS>, state, county.
+    Build the canonical `acs_county` table straight from the raw ACS
+    frame inside DuckDB: GEOID construction, renames, numeric coercion
+    and the two derived rates all happen in one CTAS over the
+    zero-copy-registered frame (no pandas passes).
+
+    Returns the canonical frame (for the parquet cache).
     """
     # Ensure required geography fields exist
     for col in ("NAME", "state", "county"):
-        if col not in df.columns:
+        if col not in df_raw.columns:
             raise RuntimeError(f"ACS response missing expected column: {col}")
 
-    # Build GEOID
-    df["GEOID"] = df["state"].astype(str) + df["county"].astype(str)
-
-    # Rename ACS numeric fields
-    rename_map = ACS_VARS.copy()
-    df = df.rename(columns=rename_map)
-
-    # Ensure all canonical numeric fields exist even if missing from rename
-    for col in rename_map.values():
-        if col not in df.columns:
-            df[col] = None
-
-    # Extra derived metrics
-    df["Poverty_Rate"] = pd.to_numeric(
-        df.get("Poverty_Count"), errors="coerce"
-    ) / pd.to_numeric(df.get("Poverty_Universe"), errors="coerce")
-
-    df["Unemployment_Rate"] = pd.to_numeric(
-        df.get("Unemployed"), errors="coerce"
-    ) / pd.to_numeric(df.get("Labor_Force"), errors="coerce")
-
-    # Coerce numerics
-    numeric_cols = [
-        "Total_Pop",
-        "Median_Income",
-        "Poverty_Count",
-        "Poverty_Universe",
-        "Poverty_Rate",
-        "Unemployed",
-        "Labor_Force",
-        "Unemployment_Rate",
-    ]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    # Keep only canonical columns we care about
-    keep_cols = [
-        "GEOID",
-        "NAME",
-        "state",
-        "county",
-        "Total_Pop",
-        "Median_Income",
-        "Poverty_Count",
-        "Poverty_Universe",
-        "Poverty_Rate",
-        "Unemployed",
-        "Labor_Force",
-        "Unemployment_Rate",
-    ]
-    df = df[keep_cols]
-
-    # Drop obvious duplicates on GEOID (keep first)
-    df = df.drop_duplicates(subset=["GEOID"])
-
-    return df
+    # ACS vars absent from the response become NULL columns so the
+    # canonical schema stays stable.
+    var_exprs = []
+    for var, name in ACS_VARS.items():
+        if var in df_raw.columns:
+            var_exprs.append(f'TRY_CAST("{var}" AS DOUBLE) AS {name}')
+        else:
+            var_exprs.append(f"NULL::DOUBLE AS {name}")
+
+    def _rate(num: str, den: str) -> str:
+        num_sql = f'TRY_CAST("{num}" AS DOUBLE)' if num in df_raw.columns else "NULL"
+        den_sql = f'TRY_CAST("{den}" AS DOUBLE)' if den in df_raw.columns else "NULL"
+        return f"{num_sql} / NULLIF({den_sql}, 0)"
+
+    # Arrow registration: DuckDB scans the Arrow buffers directly
+    # instead of copying the frame column-by-column.
+    con.register("_acs_raw", pa.Table.from_pandas(df_raw, preserve_index=False))
+    try:
+        con.execute(f"""
+            CREATE OR REPLACE TABLE acs_county AS
+            SELECT
+                state || county AS GEOID,
+                -- 4-byte join key alongside the display string (int
+                -- hash-joins beat variable-length string equality)
+                TRY_CAST(state || county AS INTEGER) AS GEOID_I32,
+                NAME,
+                state,
+                county,
+                {', '.join(var_exprs)},
+                {_rate('B17001_002E', 'B17001_001E')} AS Poverty_Rate,
+                {_rate('B23025_005E', 'B23025_003E')} AS Unemployment_Rate
+            FROM _acs_raw
+            -- one row per GEOID (keep first, matching the old
+            -- drop_duplicates behaviour)
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY state || county) = 1
+        """)
+    finally:
+        con.unregister("_acs_raw")
+
+    return con.execute("""
+        SELECT GEOID, GEOID_I32, NAME, state, county,
+               Total_Pop, Median_Income,
+               Poverty_Count, Poverty_Universe, Poverty_Rate,
+               Unemployed, Labor_Force, Unemployment_Rate
+        FROM acs_county
+    """).fetchdf()
 
 
 def _load_from_cache(year: int) -> Optional[pd.DataFrame]:
@@ -194,8 +193,7 @@ def _load_from_cache(year: int) -> Optional[pd.DataFrame]:
     path = _cache_path(year)
     if os.path.exists(path):
         try:
-            df = pd.read_csv(path, dtype=str)
-            return df
+            return pd.read_parquet(path)
         except Exception:
             return None
     return None
@@ -204,7 +202,7 @@ def _load_from_cache(year: int) -> Optional[pd.DataFrame]:
 def _save_to_cache(year: int, df: pd.DataFrame) -> None:
     _ensure_cache_dir()
     path = _cache_path(year)
-    df.to_csv(path, index=False)
+    df.to_parquet(path, compression="zstd")
 
 
 # ---------------------------------------------------------------------------
@@ -256,13 +254,33 @@ def refresh_acs_county(
             result["error"] = str(exc)
             return result
 
-    # Canonicalize
-    try:
-        df = _canonicalize_acs_df(df_raw)
-    except Exception as exc:  # noqa: BLE001
-        result["error"] = f"ACS canonicalization error: {exc}"
+    if df_raw.empty:
+        result["error"] = f"ACS produced empty frame for {year}"
         return result
 
+    if used_cache and "GEOID" in df_raw.columns:
+        # Cache stores the already-canonical frame; load it directly.
+        con.register("_acs", pa.Table.from_pandas(df_raw, preserve_index=False))
+        if "GEOID_I32" in df_raw.columns:
+            con.execute("CREATE OR REPLACE TABLE acs_county AS SELECT * FROM _acs")
+        else:
+            # Cache written before the integer key existed
+            con.execute(
+                "CREATE OR REPLACE TABLE acs_county AS "
+                "SELECT *, TRY_CAST(GEOID AS INTEGER) AS GEOID_I32 FROM _acs"
+            )
+        con.unregister("_acs")
+        df = df_raw
+    else:
+        # Canonicalize entirely inside DuckDB: renames, GEOID build,
+        # numeric coercion and the two rates happen in one vectorized
+        # SQL pass instead of several pandas passes.
+        try:
+            df = _canonicalize_in_duckdb(con, df_raw)
+        except Exception as exc:  # noqa: BLE001
+            result["error"] = f"ACS canonicalization error: {exc}"
+            return result
+
     if df.empty:
         result["error"] = f"ACS produced empty canonical DF for {year}"
         return result
@@ -275,12 +293,6 @@ def refresh_acs_county(
             # Non-fatal
             pass
 
-    # Write to DuckDB
-    con.execute("DROP TABLE IF EXISTS acs_county")
-    con.register("_acs", df)
-    con.execute("CREATE TABLE acs_county AS SELECT * FROM _acs")
-    con.unregister("_acs")
-
     rowcount = con.execute("SELECT COUNT(*) FROM acs_county").fetchone()[0]
 
     result["rows"] = int(rowcount)
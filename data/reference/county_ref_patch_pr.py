@@ -1,7 +1,8 @@
 import duckdb
-import pandas as pd
 import os
 
+from rebuild_county_ref_base import NAME_NORM_SQL
+
 DB_PATH = "data/db/v_finder.duckdb"
 PR_CENTROIDS = "data/geo/pr_centroids.csv"
 
@@ -19,58 +20,59 @@ def main():
 
     # Ensure county_ref exists
     try:
-        existing = con.execute(
-            "SELECT GEOID, STUSPS, NAME, latitude, longitude FROM county_ref"
-        ).df()
+        existing_count = con.execute("SELECT COUNT(*) FROM county_ref").fetchone()[0]
     except duckdb.CatalogException as exc:
         raise RuntimeError(
             "county_ref table does not exist. Run rebuild_county_ref_base.py first."
         ) from exc
 
-    print(f"Existing county_ref rows: {len(existing)}")
+    print(f"Existing county_ref rows: {existing_count}")
 
-    # Load PR centroids from CSV
-    pr_df = pd.read_csv(PR_CENTROIDS, dtype=str)
+    # Load PR centroids straight into DuckDB (no pandas round trip)
+    src = PR_CENTROIDS.replace("'", "''")
+    con.execute(
+        "CREATE OR REPLACE TEMP VIEW pr_src AS "
+        f"SELECT * FROM read_csv_auto('{src}', header=true, all_varchar=true)"
+    )
 
+    cols = {r[0] for r in con.execute("DESCRIBE pr_src").fetchall()}
     required_cols = ["GEOID", "NAME", "STUSPS", "INTPTLAT", "INTPTLONG"]
     for col in required_cols:
-        if col not in pr_df.columns:
+        if col not in cols:
             raise ValueError(f"PR centroid file missing required column: {col}")
 
-    # Normalize GEOID
-    pr_df["GEOID"] = pr_df["GEOID"].astype(str).str.zfill(5)
-    pr_df["NAME"] = pr_df["NAME"].astype(str)
-    pr_df["STUSPS"] = "PR"
-
-    # Determine which PR GEOIDs are missing
-    existing_ids = set(existing["GEOID"].astype(str))
-    pr_missing = pr_df[~pr_df["GEOID"].isin(existing_ids)].copy()
+    pr_total = con.execute("SELECT COUNT(*) FROM pr_src").fetchone()[0]
+    print(f"Total PR rows in file: {pr_total}")
 
-    print(f"Total PR rows in file: {len(pr_df)}")
-    print(f"Missing PR GEOIDs to insert: {len(pr_missing)}")
-
-    if pr_missing.empty:
-        print("No new PR counties to add. Patch is effectively a no-op.")
-        return
-
-    # Register the missing PR rows as a DuckDB view
-    con.register("pr_missing_df", pr_missing)
-
-    # Insert into county_ref with proper casting into latitude/longitude
+    # Insert only the missing GEOIDs — GEOID normalization, the
+    # missing-row filter, and the casts all happen in one statement.
     con.execute(
-        """
-        INSERT INTO county_ref (GEOID, STUSPS, NAME, latitude, longitude)
+        f"""
+        INSERT INTO county_ref
+            (GEOID, GEOID_I32, STUSPS, NAME, NAME_NORM, latitude, longitude)
         SELECT
-            GEOID,
-            STUSPS,
-            NAME,
-            CAST(INTPTLAT AS DOUBLE),
-            CAST(INTPTLONG AS DOUBLE)
-        FROM pr_missing_df
+            LPAD(p.GEOID, 5, '0') AS GEOID,
+            TRY_CAST(p.GEOID AS INTEGER) AS GEOID_I32,
+            'PR' AS STUSPS,
+            p.NAME,
+            {NAME_NORM_SQL.format(col="p.NAME")} AS NAME_NORM,
+            CAST(p.INTPTLAT AS DOUBLE),
+            CAST(p.INTPTLONG AS DOUBLE)
+        FROM pr_src p
+        WHERE NOT EXISTS (
+            SELECT 1 FROM county_ref c
+            WHERE c.GEOID = LPAD(p.GEOID, 5, '0')
+        )
         """
     )
 
     new_count = con.execute("SELECT COUNT(*) FROM county_ref").fetchone()[0]
+    inserted = new_count - existing_count
+    print(f"Missing PR GEOIDs inserted: {inserted}")
+    if inserted == 0:
+        print("No new PR counties to add. Patch is effectively a no-op.")
+        return
+
     print(f"county_ref patched successfully. New row count: {new_count}")
 
 
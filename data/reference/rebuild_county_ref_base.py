@@ -1,56 +1,53 @@
 import duckdb
-import pandas as pd
 
 DB = "data/db/v_finder.duckdb"
 CENT_FILE = "data/geo/county_full.csv"  # This file contains GEOID, STUSPS, NAME, latitude, longitude
 
+# SQL mirror of utils.normalize.norm_county_name (this script runs
+# standalone, so no Python UDF): lowercase, strip county-type suffixes,
+# dots to spaces, collapse whitespace, uppercase. county_agg joins
+# ppp_clean.county_norm against this column, so the two normalizations
+# must stay in lockstep.
+NAME_NORM_SQL = (
+    "upper(trim(regexp_replace(replace(regexp_replace(lower({col}), "
+    "'\\b(county|parish|census area|borough)\\b', '', 'g'), '.', ' '), "
+    "'\\s+', ' ', 'g')))"
+)
+
 
 def main():
     print("=== Rebuilding BASE county_ref (no PR yet) ===")
 
     con = duckdb.connect(DB)
 
-    # Load centroid file
-    df = pd.read_csv(CENT_FILE, dtype=str)
+    # Let DuckDB's native CSV reader ingest the centroid file directly —
+    # no pandas round trip, the bytes go straight into DuckDB storage.
+    src = CENT_FILE.replace("'", "''")
+    con.execute(
+        "CREATE OR REPLACE TEMP VIEW cent_src AS "
+        f"SELECT * FROM read_csv_auto('{src}', header=true, all_varchar=true)"
+    )
 
+    cols = {r[0] for r in con.execute("DESCRIBE cent_src").fetchall()}
     required = ["GEOID", "STUSPS", "NAME", "latitude", "longitude"]
     for col in required:
-        if col not in df.columns:
+        if col not in cols:
             raise ValueError(f"Missing column in centroid file: {col}")
 
-    # Standardize GEOID
-    df["GEOID"] = df["GEOID"].astype(str).str.zfill(5)
-
-    # Write DataFrame to an in-memory DuckDB relation
-    con.register("tmp_df", df)
-
-    # Drop old table
-    con.execute("DROP TABLE IF EXISTS county_ref")
-
-    # Create new table with explicit schema
+    # Replace in one statement (no separate DROP, no empty-table
+    # allocation) with explicit casts; GEOID standardized to 5 digits.
     con.execute(
-        """
-        CREATE TABLE county_ref (
-            GEOID VARCHAR,
-            STUSPS VARCHAR,
-            NAME VARCHAR,
-            latitude DOUBLE,
-            longitude DOUBLE
-        );
-        """
-    )
-
-    # Insert from registered DF
-    con.execute(
-        """
-        INSERT INTO county_ref
+        f"""
+        CREATE OR REPLACE TABLE county_ref AS
         SELECT
-            GEOID,
+            LPAD(GEOID, 5, '0') AS GEOID,
+            TRY_CAST(GEOID AS INTEGER) AS GEOID_I32,
             STUSPS,
             NAME,
-            CAST(latitude AS DOUBLE),
-            CAST(longitude AS DOUBLE)
-        FROM tmp_df
+            {NAME_NORM_SQL.format(col="NAME")} AS NAME_NORM,
+            CAST(latitude AS DOUBLE) AS latitude,
+            CAST(longitude AS DOUBLE) AS longitude
+        FROM cent_src
         """
     )
 
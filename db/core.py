@@ -8,6 +8,7 @@
 #
 # It guarantees that required tables exist:
 #     - ppp_clean
+#     - ppp_county_match
 #     - county_agg
 #     - county_ref
 #     - county_scores
@@ -24,133 +25,134 @@ import duckdb
 # -------------------------------------------------------------------------
 # Utility
 # -------------------------------------------------------------------------
-def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
-    sql = """
-        SELECT 1
-        FROM duckdb_tables
-        WHERE table_name = ?
-        LIMIT 1
+def _existing_tables(con: duckdb.DuckDBPyConnection) -> set[str]:
     """
-    row = con.execute(sql, [name]).fetchone()
-    return row is not None
+    One catalog scan returning every table name in main; callers test
+    membership in Python instead of firing a query per table.
+    """
+    rows = con.execute(
+        "SELECT table_name FROM duckdb_tables WHERE schema_name = 'main'"
+    ).fetchall()
+    return {r[0] for r in rows}
 
 
 # -------------------------------------------------------------------------
 # Main API
 # -------------------------------------------------------------------------
-def ensure_base_schema(con: duckdb.DuckDBPyConnection) -> None:
-    """
-    Ensure all core V_FINDER tables exist.
-    This function is SAFE to call repeatedly.
-    """
 
-    # -------------------------------------------------
-    # ppp_clean (skeleton – real ingest fills it later)
-    # -------------------------------------------------
-    if not _table_exists(con, "ppp_clean"):
-        con.execute(
-            """
-            CREATE TABLE ppp_clean AS
-            SELECT 
-                ''::VARCHAR AS loannumber
-            WHERE 0=1
-            """
-        )
-
-    # -------------------------------------------------
+# DDL for each core table, keyed by table name. Only the missing ones
+# are executed, batched into a single transaction.
+_CORE_TABLE_DDL = {
+    # ppp_clean (skeleton - real ingest fills it later)
+    "ppp_clean": """
+        CREATE TABLE ppp_clean AS
+        SELECT
+            ''::VARCHAR AS loannumber
+        WHERE 0=1
+    """,
     # ppp_ingest_log
-    # -------------------------------------------------
-    if not _table_exists(con, "ppp_ingest_log"):
-        con.execute(
-            """
-            CREATE TABLE ppp_ingest_log (
-                filename    VARCHAR PRIMARY KEY,
-                ingested_at TIMESTAMP
-            )
-            """
+    "ppp_ingest_log": """
+        CREATE TABLE ppp_ingest_log (
+            filename    VARCHAR PRIMARY KEY,
+            ingested_at TIMESTAMP
         )
-
-    # -------------------------------------------------
+    """,
+    # ppp_county_match
+    # (Materialized ppp_clean x county_ref join; rebuilt by PPP ingest)
+    "ppp_county_match": """
+        CREATE TABLE ppp_county_match AS
+        SELECT
+            ''::VARCHAR AS loannumber,
+            ''::VARCHAR AS currentapprovalamount,
+            NULL::DOUBLE AS currentapprovalamount_d,
+            NULL::DOUBLE AS jobsreported_d,
+            ''::VARCHAR AS servicinglendername,
+            ''::VARCHAR AS borrowerstate_u,
+            ''::VARCHAR AS county_norm,
+            ''::VARCHAR AS GEOID,
+            ''::VARCHAR AS STUSPS
+        WHERE 0=1
+    """,
     # county_ref
     # (Populated by the standalone repair scripts)
-    # -------------------------------------------------
-    if not _table_exists(con, "county_ref"):
-        con.execute(
-            """
-            CREATE TABLE county_ref AS
-            SELECT 
-                ''::VARCHAR AS GEOID,
-                ''::VARCHAR AS STATEFP,
-                ''::VARCHAR AS COUNTYFP,
-                ''::VARCHAR AS STUSPS,
-                ''::VARCHAR AS NAME,
-                ''::VARCHAR AS NAME_NORM,
-                NULL::DOUBLE AS INTPTLAT,
-                NULL::DOUBLE AS INTPTLONG,
-                NULL::DOUBLE AS ALAND
-            WHERE 0=1
-            """
-        )
-
-    # -------------------------------------------------
+    "county_ref": """
+        CREATE TABLE county_ref AS
+        SELECT
+            ''::VARCHAR AS GEOID,
+            NULL::INTEGER AS GEOID_I32,
+            ''::VARCHAR AS STATEFP,
+            ''::VARCHAR AS COUNTYFP,
+            ''::VARCHAR AS STUSPS,
+            ''::VARCHAR AS NAME,
+            ''::VARCHAR AS NAME_NORM,
+            NULL::DOUBLE AS INTPTLAT,
+            NULL::DOUBLE AS INTPTLONG,
+            NULL::DOUBLE AS ALAND
+        WHERE 0=1
+    """,
     # county_agg
     # (Rebuilt by PPP ingest)
-    # -------------------------------------------------
-    if not _table_exists(con, "county_agg"):
-        con.execute(
-            """
-            CREATE TABLE county_agg AS
-            SELECT 
-                ''::VARCHAR AS borrowerstate_u,
-                ''::VARCHAR AS county_norm,
-                0::BIGINT AS loan_count,
-                0::DOUBLE AS loan_total,
-                0::DOUBLE AS forgiven_total,
-                0::DOUBLE AS jobs_reported
-            WHERE 0=1
-            """
-        )
-
-    # -------------------------------------------------
+    "county_agg": """
+        CREATE TABLE county_agg AS
+        SELECT
+            ''::VARCHAR AS borrowerstate_u,
+            ''::VARCHAR AS county_norm,
+            0::BIGINT AS loan_count,
+            0::DOUBLE AS loan_total,
+            0::DOUBLE AS forgiven_total,
+            0::DOUBLE AS jobs_reported
+        WHERE 0=1
+    """,
     # county_scores (from scoring scripts)
-    # -------------------------------------------------
-    if not _table_exists(con, "county_scores"):
-        con.execute(
-            """
-            CREATE TABLE county_scores AS
-            SELECT 
-                ''::VARCHAR AS GEOID,
-                ''::VARCHAR AS NAME,
-                0::DOUBLE AS score_raw,
-                0::DOUBLE AS score_norm
-            WHERE 0=1
-            """
-        )
-
-    # -------------------------------------------------
+    "county_scores": """
+        CREATE TABLE county_scores AS
+        SELECT
+            ''::VARCHAR AS GEOID,
+            ''::VARCHAR AS NAME,
+            0::DOUBLE AS score_raw,
+            0::DOUBLE AS score_norm
+        WHERE 0=1
+    """,
     # acs_county
     # (Populated by ACS pipeline)
-    # -------------------------------------------------
-    if not _table_exists(con, "acs_county"):
-        con.execute(
-            """
-            CREATE TABLE acs_county AS
-            SELECT 
-                ''::VARCHAR AS GEOID,
-                ''::VARCHAR AS NAME,
-                ''::VARCHAR AS state,
-                ''::VARCHAR AS county,
-                0::BIGINT AS Total_Pop,
-                0::BIGINT AS Median_Income,
-                0::BIGINT AS Poverty_Count,
-                0::BIGINT AS Poverty_Universe,
-                0::DOUBLE AS Poverty_Rate,
-                0::BIGINT AS Unemployed,
-                0::BIGINT AS Labor_Force,
-                0::DOUBLE AS Unemployment_Rate
-            WHERE 0=1
-            """
-        )
+    "acs_county": """
+        CREATE TABLE acs_county AS
+        SELECT
+            ''::VARCHAR AS GEOID,
+            NULL::INTEGER AS GEOID_I32,
+            ''::VARCHAR AS NAME,
+            ''::VARCHAR AS state,
+            ''::VARCHAR AS county,
+            0::BIGINT AS Total_Pop,
+            0::BIGINT AS Median_Income,
+            0::BIGINT AS Poverty_Count,
+            0::BIGINT AS Poverty_Universe,
+            0::DOUBLE AS Poverty_Rate,
+            0::BIGINT AS Unemployed,
+            0::BIGINT AS Labor_Force,
+            0::DOUBLE AS Unemployment_Rate
+        WHERE 0=1
+    """,
+}
+
+
+def ensure_base_schema(con: duckdb.DuckDBPyConnection) -> None:
+    """
+    Ensure all core V_FINDER tables exist.
+    This function is SAFE to call repeatedly.
+    """
+
+    existing = _existing_tables(con)
+
+    stmts = [
+        ddl.strip() for name, ddl in _CORE_TABLE_DDL.items() if name not in existing
+    ]
+    if not stmts:
+        return None
+
+    # One transaction for all missing tables: a single WAL/metadata
+    # flush instead of one auto-commit per CREATE.
+    con.execute("BEGIN;\n" + ";\n".join(stmts) + ";\nCOMMIT;")
 
     # Done
     return None
@@ -33,8 +33,16 @@ def get_connection() -> duckdb.DuckDBPyConnection:
         _connection = duckdb.connect(DB_PATH, read_only=False)
 
         # Recommended runtime settings
-        _connection.execute("PRAGMA threads=4;")
+        n_threads = os.cpu_count() or 4
+        _connection.execute(f"PRAGMA threads={n_threads};")
         _connection.execute("PRAGMA enable_progress_bar;")
+        _connection.execute("PRAGMA enable_object_cache;")
+        # Bulk CTAS rebuilds (county_agg etc.) don't depend on row order
+        _connection.execute("PRAGMA preserve_insertion_order=false;")
+
+        tmp_dir = os.path.join(os.path.dirname(DB_PATH), "tmp")
+        os.makedirs(tmp_dir, exist_ok=True)
+        _connection.execute(f"PRAGMA temp_directory='{tmp_dir}';")
 
     return _connection
 
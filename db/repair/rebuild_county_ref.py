@@ -1,6 +1,7 @@
 # rebuild_county_ref.py
 import duckdb
 import pandas as pd
+import pyarrow as pa
 import os
 
 DB = r"C:\scripts\v_finder\data\db\v_finder.duckdb"
@@ -24,17 +25,16 @@ for col in ["INTPTLAT", "INTPTLONG", "ALAND"]:
 
 con = duckdb.connect(DB)
 
-print("Dropping old county_ref…")
-con.execute("DROP TABLE IF EXISTS county_ref")
-
 print("Registering df_view…")
-con.register("df_view", df)
+# Arrow registration: the CTAS reads the Arrow buffers zero-copy
+con.register("df_view", pa.Table.from_pandas(df, preserve_index=False))
 
 print("Creating county_ref…")
 con.execute("""
-    CREATE TABLE county_ref AS
+    CREATE OR REPLACE TABLE county_ref AS
     SELECT
         GEOID,
+        TRY_CAST(GEOID AS INTEGER) AS GEOID_I32,
         STATEFP,
         COUNTYFP,
         STUSPS,
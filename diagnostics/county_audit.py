@@ -7,40 +7,58 @@ import duckdb
 import pandas as pd
 
 
+def _has_match_table(con) -> bool:
+    row = con.execute(
+        "SELECT 1 FROM duckdb_tables WHERE table_name = 'ppp_county_match' LIMIT 1"
+    ).fetchone()
+    if row is None:
+        return False
+    return con.execute("SELECT COUNT(*) FROM ppp_county_match").fetchone()[0] > 0
+
+
 def run_county_alignment_audit(con):
-    q_summary = """
-        SELECT
-            COUNT(*) AS total_clean,
-            SUM(CASE WHEN matched = 1 THEN 1 ELSE 0 END) AS matched,
-            100.0 * SUM(CASE WHEN matched = 1 THEN 1 ELSE 0 END) / COUNT(*) AS match_pct
-        FROM (
+    # Prefer the match table materialized by PPP ingest; otherwise run
+    # the ppp_clean × county_ref join once into a temp table. Either
+    # way, both the summary and the unmatched breakdown read the same
+    # materialization, so the join scan runs at most a single time.
+    if _has_match_table(con):
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE _county_audit_j AS
+            SELECT borrowerstate_u, county_norm, GEOID
+            FROM ppp_county_match
+        """)
+    else:
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE _county_audit_j AS
             SELECT
                 p.borrowerstate_u,
                 p.county_norm,
-                CASE WHEN r.GEOID IS NOT NULL THEN 1 ELSE 0 END AS matched
+                r.GEOID
             FROM ppp_clean p
             LEFT JOIN county_ref r
               ON p.borrowerstate_u = r.STUSPS
              AND p.county_norm = r.NAME_NORM
-        )
-    """
+        """)
 
-    summary = con.execute(q_summary).fetchdf()
+    summary = con.execute("""
+        SELECT
+            COUNT(*) AS total_clean,
+            COUNT(*) FILTER (WHERE GEOID IS NOT NULL) AS matched,
+            100.0 * COUNT(*) FILTER (WHERE GEOID IS NOT NULL) / COUNT(*) AS match_pct
+        FROM _county_audit_j
+    """).fetchdf()
 
-    q_unmatched = """
+    unmatched = con.execute("""
         SELECT
             borrowerstate_u,
             county_norm,
             COUNT(*) AS occurrences
-        FROM ppp_clean p
-        LEFT JOIN county_ref r
-          ON p.borrowerstate_u = r.STUSPS
-         AND p.county_norm = r.NAME_NORM
-        WHERE r.GEOID IS NULL
+        FROM _county_audit_j
+        WHERE GEOID IS NULL
         GROUP BY 1,2
         ORDER BY occurrences DESC
-    """
+    """).fetchdf()
 
-    unmatched = con.execute(q_unmatched).fetchdf()
+    con.execute("DROP TABLE IF EXISTS _county_audit_j")
 
     return summary, unmatched
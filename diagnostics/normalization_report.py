@@ -14,119 +14,134 @@ Adds:
         - loan_per_capita z-score
         - poverty rate deviation
     • Outlier flag matrix
+
+The whole report is computed inside DuckDB in one pass over a temp
+table; only the three small result sets (summary, sample, outliers)
+cross into pandas.
 """
 
-def _exists(con, name):
-    return (
-        con.execute(
-            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
-            [name],
-        ).fetchone()[0]
-        == 1
-    )
+def _tables(con):
+    # One catalog scan; callers test membership instead of issuing an
+    # information_schema query per table
+    rows = con.execute(
+        "SELECT lower(table_name) FROM duckdb_tables() "
+        "UNION ALL "
+        "SELECT lower(view_name) FROM duckdb_views() WHERE NOT internal"
+    ).fetchall()
+    return {r[0] for r in rows}
+
+
+_Z_COLS = ["loan_total", "loan_total_per_capita", "loans_per_1k", "Poverty_Rate"]
 
 
 def build_normalization_report(con, sample_limit=500):
+    tables = _tables(con)
     for tbl in ("ppp_clean", "county_ref"):
-        if not _exists(con, tbl):
+        if tbl not in tables:
             return (
                 pd.DataFrame({"error": [f"Missing table: {tbl}"]}),
                 pd.DataFrame(),
                 pd.DataFrame(),
             )
 
-    # Core BEFORE → AFTER sample
-    base_df = con.execute(
-        """
-        SELECT DISTINCT
-            p.borrowerstate_u AS borrower_state,
-            p.ProjectCountyName AS county_raw,
-            p.county_norm AS county_norm,
-            r.NAME AS matched_name,
-            r.NAME_NORM AS matched_norm,
-            r.GEOID AS geoid
-        FROM ppp_clean p
-        LEFT JOIN county_ref r
-          ON p.borrowerstate_u = r.STUSPS
-         AND p.county_norm = r.NAME_NORM
-        """
-    ).fetchdf()
+    # PPP/ACS enrichment degrades to NULL columns when the tables are
+    # missing (the SQL is assembled accordingly).
+    has_agg = "county_agg" in tables
+    has_acs = "acs_county" in tables
 
-    base_df["matched"] = base_df["geoid"].notna()
+    agg_cols = (
+        "g.loan_count, g.loan_total"
+        if has_agg
+        else "NULL::BIGINT AS loan_count, NULL::DOUBLE AS loan_total"
+    )
+    agg_join = "LEFT JOIN county_agg g ON g.GEOID = b.GEOID" if has_agg else ""
+    acs_cols = (
+        "a.Total_Pop, a.Median_Income, a.Poverty_Rate"
+        if has_acs
+        else (
+            "NULL::DOUBLE AS Total_Pop, NULL::DOUBLE AS Median_Income, "
+            "NULL::DOUBLE AS Poverty_Rate"
+        )
+    )
+    acs_join = "LEFT JOIN acs_county a ON a.GEOID = b.GEOID" if has_acs else ""
 
-    # Join PPP + ACS if present
-    if _exists(con, "county_agg"):
-        agg = con.execute(
-            "SELECT GEOID, loan_count, loan_total FROM county_agg"
+    # Sample stddev (ddof=1), matching pandas Series.std — population
+    # stddev shifts values near the 2.5 outlier threshold
+    z_exprs = ", ".join(
+        f"({c} - AVG({c}) OVER ()) / NULLIF(STDDEV_SAMP({c}) OVER (), 0) AS {c}_z"
+        for c in _Z_COLS
+    )
+    flag_expr = " OR ".join(f"abs(COALESCE({c}_z, 0)) >= 2.5" for c in _Z_COLS)
+
+    # Join, per-capita ratios, z-scores and the outlier flag in a single
+    # statement; downstream queries read the small temp table.
+    con.execute(
+        f"""
+        CREATE OR REPLACE TEMP TABLE _norm_report AS
+        WITH base AS (
+            SELECT DISTINCT
+                p.borrowerstate_u AS borrower_state,
+                p.ProjectCountyName AS county_raw,
+                p.county_norm AS county_norm,
+                r.NAME AS matched_name,
+                r.NAME_NORM AS matched_norm,
+                r.GEOID AS GEOID
+            FROM ppp_clean p
+            LEFT JOIN county_ref r
+              ON p.borrowerstate_u = r.STUSPS
+             AND p.county_norm = r.NAME_NORM
+        ),
+        enriched AS (
+            SELECT
+                b.*,
+                b.GEOID IS NOT NULL AS matched,
+                {agg_cols},
+                {acs_cols},
+                loan_total / NULLIF(Total_Pop, 0) AS loan_total_per_capita,
+                loan_count * 1000.0 / NULLIF(Total_Pop, 0) AS loans_per_1k
+            FROM base b
+            {agg_join}
+            {acs_join}
+        )
+        SELECT
+            *,
+            CASE WHEN {flag_expr} THEN 1 ELSE 0 END AS outlier_flag
+        FROM (SELECT *, {z_exprs} FROM enriched)
+        """
+    )
+    try:
+        # Summary
+        total, matched = con.execute(
+            "SELECT COUNT(*), COUNT(*) FILTER (matched) FROM _norm_report"
+        ).fetchone()
+        summary_df = pd.DataFrame(
+            {
+                "Total county strings": [total],
+                "Matched county_ref": [matched],
+                "Unmatched": [total - matched],
+                "Match %": [round(matched / total * 100.0, 2) if total else 0],
+            }
+        )
+
+        # Sampling (match your UI): up to half unmatched, rest matched
+        n_unmatched = min(total - matched, sample_limit // 2)
+        n_matched = sample_limit - n_unmatched
+        sample_df = con.execute(
+            f"""
+            (SELECT * FROM _norm_report WHERE NOT matched LIMIT {n_unmatched})
+            UNION ALL
+            (SELECT * FROM _norm_report WHERE matched LIMIT {n_matched})
+            """
         ).fetchdf()
-        base_df = base_df.merge(agg, on="GEOID", how="left")
 
-    if _exists(con, "acs_county"):
-        acs = con.execute(
-            "SELECT GEOID, Total_Pop, Median_Income, Poverty_Rate FROM acs_county"
+        out_cols = ["borrower_state", "county_raw", "county_norm",
+                    "matched", "matched_name", "GEOID"]
+        for c in _Z_COLS:
+            out_cols += [c, c + "_z"]
+        outliers_df = con.execute(
+            f"SELECT {', '.join(out_cols)} FROM _norm_report WHERE outlier_flag = 1"
         ).fetchdf()
-        base_df = base_df.merge(acs, on="GEOID", how="left")
-
-    # Derived PPP/ACS metrics
-    base_df["loan_total_per_capita"] = (
-        base_df["loan_total"] / base_df["Total_Pop"]
-    ).replace([float("inf")], pd.NA)
-    base_df["loans_per_1k"] = (
-        base_df["loan_count"] / base_df["Total_Pop"] * 1000.0
-    ).replace([float("inf")], pd.NA)
-
-    # Summary
-    total = len(base_df)
-    matched = int(base_df["matched"].sum())
-    summary_df = pd.DataFrame(
-        {
-            "Total county strings": [total],
-            "Matched county_ref": [matched],
-            "Unmatched": [total - matched],
-            "Match %": [round(matched / total * 100.0, 2) if total else 0],
-        }
-    )
-
-    # --- OUTLIER DIAGNOSTICS -----------------------------------------
-    df2 = base_df.copy()
-    numeric_cols = ["loan_total", "loan_total_per_capita", "loans_per_1k", "Poverty_Rate"]
-
-    for col in numeric_cols:
-        if col in df2:
-            s = pd.to_numeric(df2[col], errors="coerce")
-            df2[col + "_z"] = (s - s.mean()) / (s.std() if s.std() else 1)
-
-    # Outlier rules: any |z| >= 2.5
-    df2["outlier_flag"] = (
-        (df2.filter(regex="_z$").abs() >= 2.5).any(axis=1)
-    ).astype(int)
-
-    outliers_df = df2[df2["outlier_flag"] == 1].copy()
-    outliers_df = outliers_df[
-        [
-            "borrower_state",
-            "county_raw",
-            "county_norm",
-            "matched",
-            "matched_name",
-            "geoid",
-            "loan_total",
-            "loan_total_z",
-            "loan_total_per_capita",
-            "loan_total_per_capita_z",
-            "loans_per_1k",
-            "loans_per_1k_z",
-            "Poverty_Rate",
-            "Poverty_Rate_z",
-        ]
-    ]
-
-    # Sampling (match your UI)
-    unmatched_df = base_df[~base_df["matched"]]
-    matched_df = base_df[base_df["matched"]]
-
-    sample_unmatched = unmatched_df.head(sample_limit // 2)
-    sample_matched = matched_df.head(sample_limit - len(sample_unmatched))
-    sample_df = pd.concat([sample_unmatched, sample_matched], ignore_index=True)
+    finally:
+        con.execute("DROP TABLE IF EXISTS _norm_report")
 
     return summary_df, sample_df, outliers_df
@@ -48,7 +48,12 @@ def main():
     )
     args = ap.parse_args()
 
-    df = pd.read_csv(args.inp, dtype=str, encoding="utf-8", na_filter=False)
+    # pyarrow engine: multithreaded parse, Arrow-backed string columns
+    # (no per-cell Python string boxing); GEOID is re-padded below so
+    # numeric inference can't cost us leading zeros
+    df = pd.read_csv(
+        args.inp, engine="pyarrow", dtype_backend="pyarrow", encoding="utf-8"
+    )
     df.columns = [c.strip().upper() for c in df.columns]
 
     # -------------------------------
@@ -69,7 +74,11 @@ def main():
     if "NAME_NORM" not in df.columns:
         if "NAME" not in df.columns:
             raise RuntimeError("county_2025.csv missing column NAME")
-        df["NAME_NORM"] = df["NAME"].apply(norm_county_name)
+        # Normalize each distinct name once and broadcast via .map —
+        # county names repeat heavily, so this is far fewer Python calls
+        # than a per-row .apply.
+        uniq = df["NAME"].unique()
+        df["NAME_NORM"] = df["NAME"].map(dict(zip(uniq, map(norm_county_name, uniq))))
 
     # -------------------------------
     # Validate Required Columns
@@ -1,11 +1,34 @@
-import pandas as pd
+import duckdb
+
 from utils.normalize import norm_county_name
 
-main_df = pd.read_csv('data/geo/county_2025.csv')
-cent_df = pd.read_csv('data/geo/County_Centroids.csv')  # Or counties_centroids.txt with sep='|'
-cent_df = cent_df.rename(columns={'cfips': 'GEOID', 'latitude': 'INTPTLAT', 'longitude': 'INTPTLONG'})  # Fixed to 'cfips'
-merged_df = pd.merge(main_df, cent_df, on='GEOID', how='outer')
-merged_df['STATEFP'] = merged_df['GEOID'].str[:2]
-merged_df['COUNTYFP'] = merged_df['GEOID'].str[2:]
-merged_df['NAME_NORM'] = merged_df['NAME'].apply(norm_county_name)
-merged_df.to_csv('data/geo/full_ref_with_centroids.csv', index=False)  # Use as ref
\ No newline at end of file
+MAIN_CSV = 'data/geo/county_2025.csv'
+CENT_CSV = 'data/geo/County_Centroids.csv'  # Or counties_centroids.txt with sep='|'
+OUT_CSV = 'data/geo/full_ref_with_centroids.csv'
+
+con = duckdb.connect()
+# norm_county_name stays Python; registered as a scalar UDF so the rest
+# of the pipeline (CSV parse, outer join, FIPS split, CSV write) runs
+# inside DuckDB in one statement with no pandas round trip.
+con.create_function("norm_county_name", norm_county_name, ["VARCHAR"], "VARCHAR")
+
+con.execute(f"""
+    COPY (
+        SELECT
+            GEOID,
+            m.* EXCLUDE (GEOID),
+            c.INTPTLAT,
+            c.INTPTLONG,
+            substr(GEOID, 1, 2) AS STATEFP,
+            substr(GEOID, 3) AS COUNTYFP,
+            norm_county_name(m.NAME) AS NAME_NORM
+        FROM read_csv_auto('{MAIN_CSV}', header=true, all_varchar=true) m
+        FULL OUTER JOIN (
+            SELECT
+                cfips AS GEOID,  -- Fixed to 'cfips'
+                latitude AS INTPTLAT,
+                longitude AS INTPTLONG
+            FROM read_csv_auto('{CENT_CSV}', header=true, all_varchar=true)
+        ) c USING (GEOID)
+    ) TO '{OUT_CSV}' (HEADER, FORMAT CSV)
+""")  # Use as ref
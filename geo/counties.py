@@ -1,5 +1,7 @@
 import os
 import geopandas as gpd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
 @st.cache_resource(show_spinner=False)
@@ -31,7 +33,12 @@ def load_counties(path: str) -> gpd.GeoDataFrame:
         if "NAME" not in gdf.columns:
             gdf["NAME"] = ""
 
-    gdf["GEOID"] = gdf["GEOID"].astype(str).str.replace(r"\D", "", regex=True).str.zfill(5).str[-5:]
+    # Strip non-digits / pad / trim via Arrow compute kernels (SIMD C++)
+    # instead of the per-row Python regex engine
+    arr = pa.array(gdf["GEOID"].astype(str))
+    arr = pc.replace_substring_regex(arr, r"\D", "")
+    arr = pc.utf8_lpad(arr, 5, "0")
+    gdf["GEOID"] = pc.utf8_slice_codeunits(arr, -5).to_numpy(zero_copy_only=False)
 
     # Ensure WGS84
     if gdf.crs is None:
@@ -39,6 +46,7 @@ def load_counties(path: str) -> gpd.GeoDataFrame:
     else:
         gdf = gdf.to_crs("EPSG:4326")
 
-    # Build spatial index once
-    _ = gdf.sindex
+    # No eager .sindex warmup: geopandas builds the STR-tree lazily on
+    # first access and caches it on the frame, which cache_resource
+    # shares across callers — pure choropleth pages never pay for it
     return gdf
@@ -31,6 +31,10 @@ def load_county_reference(path: str) -> pd.DataFrame:
 
     df = pd.read_csv(path, dtype=str, encoding="utf-8", na_filter=False, sep=sep)
     df.columns = [c.strip().upper() for c in df.columns]
+    # Arrow-backed strings: the .str chains below (regex strip, zfill,
+    # slicing) run pyarrow's C++ kernels over contiguous UTF-8 buffers
+    # instead of the per-cell Python path over object arrays
+    df = df.astype("string[pyarrow]")
 
     if "GEOID" in df.columns:
         df["GEOID"] = df["GEOID"].str.replace(r"\D", "", regex=True).str.zfill(5)
@@ -44,7 +48,9 @@ def load_county_reference(path: str) -> pd.DataFrame:
             df["GEOID"] = df["STATEFP"].str.zfill(2) + df["COUNTYFP"].str.zfill(3)
 
     if "NAME_NORM" not in df.columns and "NAME" in df.columns:
-        df["NAME_NORM"] = df["NAME"].apply(norm_county_name)
+        # Normalize per distinct name, then broadcast (names repeat)
+        uniq = df["NAME"].unique()
+        df["NAME_NORM"] = df["NAME"].map(dict(zip(uniq, map(norm_county_name, uniq))))
 
     missing = REQUIRED_BASE_COLS - set(df.columns)
     if missing:
@@ -66,22 +72,94 @@ def load_county_reference(path: str) -> pd.DataFrame:
     return df[keep].copy()
 
 def ensure_county_ref(con: duckdb.DuckDBPyConnection, county_ref_csv: str) -> dict:
-    df = load_county_reference(county_ref_csv)
-
-    con.execute("DROP TABLE IF EXISTS county_ref")
-    con.register("county_ref_df", df)
-    con.execute("""
-        CREATE TABLE county_ref AS
-        SELECT
-            GEOID::VARCHAR AS GEOID,
-            STATEFP::VARCHAR AS STATEFP,
-            COUNTYFP::VARCHAR AS COUNTYFP,
-            STUSPS::VARCHAR AS STUSPS,
-            NAME::VARCHAR AS NAME,
-            NAME_NORM::VARCHAR AS NAME_NORM,
-            INTPTLAT::DOUBLE AS INTPTLAT,
-            INTPTLONG::DOUBLE AS INTPTLONG,
-            ALAND::DOUBLE AS ALAND
-        FROM county_ref_df
-    """)
-    return {"rows": int(len(df))}
\ No newline at end of file
+    """
+    (Re)build county_ref straight from the CSV inside DuckDB.
+
+    read_csv parses multi-threaded into columnar buffers and every
+    normalization step runs in SQL, so no pandas frame is materialized
+    in between; norm_county_name stays Python and is applied through a
+    scalar UDF only when the file lacks a NAME_NORM column.
+    """
+    if not county_ref_csv or not os.path.exists(county_ref_csv):
+        raise FileNotFoundError(f"County reference file not found: {county_ref_csv}")
+
+    ext = os.path.splitext(county_ref_csv)[1].lower()
+    sep = '\t' if ext == ".txt" else ','
+    if 'gaz' in county_ref_csv.lower():
+        sep = '|'
+
+    con.execute(
+        "CREATE OR REPLACE TEMP TABLE county_ref_raw AS "
+        "SELECT * FROM read_csv(?, sep=?, header=true, all_varchar=true)",
+        [county_ref_csv, sep],
+    )
+    try:
+        cols = {
+            d[0].strip().upper()
+            for d in con.execute("SELECT * FROM county_ref_raw LIMIT 0").description
+        }
+
+        # GEOID ↔ STATEFP+COUNTYFP and NAME→NAME_NORM are derivable;
+        # everything else in REQUIRED_BASE_COLS must come from the file.
+        missing = REQUIRED_BASE_COLS - cols
+        if "GEOID" in cols:
+            missing -= {"STATEFP", "COUNTYFP"}
+        elif {"STATEFP", "COUNTYFP"} <= cols:
+            missing -= {"GEOID"}
+        if "NAME" in cols:
+            missing -= {"NAME_NORM"}
+        if missing:
+            raise ValueError(f"County reference missing columns: {missing}")
+
+        if "GEOID" in cols:
+            digits = "regexp_replace(GEOID, '[^0-9]', '', 'g')"
+            # zfill semantics: pad short values, never truncate long ones
+            geoid_expr = (
+                f"CASE WHEN length({digits}) >= 5 THEN {digits} "
+                f"ELSE lpad({digits}, 5, '0') END"
+            )
+            raw_cols = "* EXCLUDE (GEOID)"
+        else:
+            geoid_expr = "lpad(STATEFP, 2, '0') || lpad(COUNTYFP, 3, '0')"
+            raw_cols = "*"
+
+        if "NAME_NORM" in cols:
+            name_norm_expr = "NAME_NORM::VARCHAR"
+        else:
+            try:
+                con.create_function(
+                    "norm_county_name", norm_county_name, ["VARCHAR"], "VARCHAR"
+                )
+            except duckdb.Error:
+                pass  # already registered on this connection
+            name_norm_expr = "norm_county_name(NAME)"
+
+        statefp_expr = "STATEFP::VARCHAR" if "STATEFP" in cols else "substr(GEOID, 1, 2)"
+        countyfp_expr = "COUNTYFP::VARCHAR" if "COUNTYFP" in cols else "substr(GEOID, 3)"
+
+        def _num(col: str) -> str:
+            return f"TRY_CAST({col} AS DOUBLE)" if col in cols else "NULL::DOUBLE"
+
+        rows = con.execute(f"""
+            CREATE OR REPLACE TABLE county_ref AS
+            SELECT
+                GEOID,
+                TRY_CAST(GEOID AS INTEGER) AS GEOID_I32,
+                {statefp_expr} AS STATEFP,
+                {countyfp_expr} AS COUNTYFP,
+                STUSPS::VARCHAR AS STUSPS,
+                NAME::VARCHAR AS NAME,
+                {name_norm_expr} AS NAME_NORM,
+                {_num("INTPTLAT")} AS INTPTLAT,
+                {_num("INTPTLONG")} AS INTPTLONG,
+                {_num("ALAND")} AS ALAND
+            FROM (SELECT {raw_cols}, {geoid_expr} AS GEOID FROM county_ref_raw)
+        """).fetchone()[0]
+        # ART index: point lookups by GEOID (county profile, map joins)
+        # skip the scan; recreated here because the CTAS replaced the table
+        con.execute(
+            "CREATE INDEX IF NOT EXISTS idx_county_ref_geoid ON county_ref(GEOID)"
+        )
+    finally:
+        con.execute("DROP TABLE IF EXISTS county_ref_raw")
+    return {"rows": int(rows)}
\ No newline at end of file
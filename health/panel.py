@@ -8,16 +8,20 @@ def render_health_panel(con: duckdb.DuckDBPyConnection) -> None:
     st.title("Health Panel")
     st.caption("Launch diagnostics for DuckDB analytics + optional local PPP artifacts.")
 
+    # One catalog scan per render; the membership checks below are then
+    # set lookups instead of an information_schema query per call.
+    try:
+        existing = {
+            r[0]
+            for r in con.execute(
+                "SELECT lower(table_name) FROM information_schema.tables"
+            ).fetchall()
+        }
+    except Exception:
+        existing = set()
+
     def _table_exists(name: str) -> bool:
-        try:
-            return bool(
-                con.execute(
-                    "SELECT COUNT(*) FROM information_schema.tables WHERE lower(table_name) = lower(?)",
-                    [name],
-                ).fetchone()[0]
-            )
-        except Exception:
-            return False
+        return name.lower() in existing
 
     # -----------------------------------------------------------------
     # Table counts
@@ -34,15 +38,19 @@ def render_health_panel(con: duckdb.DuckDBPyConnection) -> None:
         ("ppp_clean", "PPP Clean (optional)"),
     ]
 
-    counts = {}
-    for t, _label in tables:
-        if _table_exists(t):
-            try:
-                counts[t] = int(con.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0])
-            except Exception:
-                counts[t] = 0
-        else:
-            counts[t] = 0
+    # All row counts in a single UNION ALL statement — one round trip
+    # instead of one query per table (names come from the literal list
+    # above, so inlining them is safe).
+    counts = {t: 0 for t, _label in tables}
+    present = [t for t, _label in tables if _table_exists(t)]
+    if present:
+        try:
+            sql = " UNION ALL ".join(
+                f"SELECT '{t}' AS name, COUNT(*) AS n FROM {t}" for t in present
+            )
+            counts.update({name: int(n) for name, n in con.execute(sql).fetchall()})
+        except Exception:
+            pass
 
     c1, c2, c3, c4 = st.columns(4)
     c1.metric("county_ref rows", f"{counts.get('county_ref', 0):,}")
@@ -120,16 +128,37 @@ def render_health_panel(con: duckdb.DuckDBPyConnection) -> None:
     # Optional join sanity (only if county_ref exists, already validated)
     try:
         st.subheader("Known County Join Rate (PPP → county_ref)")
-        df_join = con.execute(
-            """
-            SELECT
-              COUNT(*) AS ppp_rows,
-              SUM(CASE WHEN cr.GEOID IS NOT NULL THEN 1 ELSE 0 END) AS matched_rows
-            FROM ppp_clean p
-            LEFT JOIN county_ref cr
-              ON p.BorrowerCounty = cr.NAME AND p.BorrowerState = cr.STUSPS
-            """
-        ).fetchdf()
-        st.dataframe(df_join, use_container_width=True)
+        if "ppp_by_geoid" in existing:
+            # Ingest-time rollup: county-sized scan instead of re-joining
+            # every PPP row on each render
+            ppp_rows, matched_rows = con.execute(
+                """
+                SELECT
+                  SUM(loan_count),
+                  SUM(loan_count) FILTER (GEOID IS NOT NULL)
+                FROM ppp_by_geoid
+                """
+            ).fetchone()
+        else:
+            ppp_rows, matched_rows = con.execute(
+                """
+                SELECT
+                  COUNT(*),
+                  COUNT(cr.GEOID)
+                FROM ppp_clean p
+                LEFT JOIN county_ref cr
+                  ON p.county_norm = cr.NAME_NORM
+                 AND p.borrowerstate_u = cr.STUSPS
+                """
+            ).fetchone()
+        ppp_rows = int(ppp_rows or 0)
+        matched_rows = int(matched_rows or 0)
+        j1, j2, j3 = st.columns(3)
+        j1.metric("PPP rows", f"{ppp_rows:,}")
+        j2.metric("Matched rows", f"{matched_rows:,}")
+        j3.metric(
+            "Match %",
+            f"{matched_rows / ppp_rows * 100.0:.1f}%" if ppp_rows else "—",
+        )
     except Exception as e:
         st.warning(f"PPP join-rate check failed: {e}")
@@ -31,17 +31,29 @@ def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
         return False
 
 
-def _load_county_map_frame(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_county_map_frame(
+    _con: duckdb.DuckDBPyConnection,
+    state: str | None = None,
+) -> pd.DataFrame:
     """
     Load county-level lat/lon + risk metrics for mapping.
     Uses compat views created in app.py.
+
+    Cached across Streamlit reruns (the underscore keeps the connection
+    out of the hash; the state filter is part of the key); the TTL
+    bounds staleness after a rebuild without re-running the join on
+    every widget interaction.
     """
-    if not _table_exists(con, "county_scores"):
+    if not _table_exists(_con, "county_scores"):
         return pd.DataFrame()
 
     # county_ref provides lat/lon + names
-    join_ref = _table_exists(con, "county_ref")
+    join_ref = _table_exists(_con, "county_ref")
 
+    # Filtering in SQL means a single-state view never moves the other
+    # ~49 states across the DuckDB→pandas boundary
+    params = [state] if state else []
     sql = f"""
         SELECT
             cs.GEOID,
@@ -53,10 +65,12 @@ def _load_county_map_frame(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
         FROM county_scores cs
         {"LEFT JOIN county_ref cr ON cs.GEOID = cr.GEOID" if join_ref else ""}
         WHERE cr.lat IS NOT NULL AND cr.lon IS NOT NULL
+        {"AND cr.STUSPS = ?" if state else ""}
     """
 
     try:
-        df = con.execute(sql).fetchdf()
+        # Arrow fetch: columnar blocks straight into the frame
+        df = _con.execute(sql, params).fetch_arrow_table().to_pandas()
     except Exception:
         return pd.DataFrame()
 
@@ -88,19 +102,27 @@ def render_nationwide_map(
     st.title("Nationwide Risk Map")
     st.caption("County-level fraud and risk heatmap (analytics-only)")
 
-    df = _load_county_map_frame(con)
+    df = _load_county_map_frame(con, state=default_state)
     if df.empty:
         st.warning("No county map data available.")
         return
 
-    # Optional state filter
-    if default_state and "STUSPS" in df.columns:
-        df = df[df["STUSPS"] == default_state]
-
     # Color scale by risk
     max_risk = float(df["risk_score"].max()) if "risk_score" in df.columns else 1.0
     df["risk_norm"] = df["risk_score"] / max(max_risk, 1e-6)
 
+    # Ship only the columns the layer and tooltip read, downcast to
+    # float32 — county-scale precision survives and the JSON payload
+    # over the Streamlit websocket roughly halves
+    df = df[["lon", "lat", "NAME", "risk_score", "risk_norm"]].astype(
+        {
+            "lon": "float32",
+            "lat": "float32",
+            "risk_score": "float32",
+            "risk_norm": "float32",
+        }
+    )
+
     layer = pdk.Layer(
         "ScatterplotLayer",
         data=df,
@@ -11,12 +11,26 @@ import streamlit as st
 
 from config import TIGER_COUNTY_ZIP_URL, TIGER_COUNTY_CACHE_ZIP, TIGER_COUNTY_CACHE_DIR
 
+def _download_tiger_zip() -> None:
+    """Stream the TIGER zip to disk in 1 MB chunks (~80 MB file).
+
+    Writes to a .part file and renames on success so a dropped
+    connection never leaves a truncated zip behind.
+    """
+    r = requests.get(TIGER_COUNTY_ZIP_URL, stream=True, timeout=30)
+    with r:
+        r.raise_for_status()
+        tmp = TIGER_COUNTY_CACHE_ZIP.with_suffix(".part")
+        with open(tmp, "wb") as f:
+            for chunk in r.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+        tmp.replace(TIGER_COUNTY_CACHE_ZIP)
+
+
 def _ensure_tiger_counties() -> Path:
     TIGER_COUNTY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
     if not TIGER_COUNTY_CACHE_ZIP.exists():
-        r = requests.get(TIGER_COUNTY_ZIP_URL, timeout=180)
-        r.raise_for_status()
-        TIGER_COUNTY_CACHE_ZIP.write_bytes(r.content)
+        _download_tiger_zip()
     # extract if needed
     shp = TIGER_COUNTY_CACHE_DIR / "tl_2024_us_county.shp"
     if not shp.exists():
@@ -24,10 +38,19 @@ def _ensure_tiger_counties() -> Path:
             z.extractall(TIGER_COUNTY_CACHE_DIR)
     return shp
 
-@st.cache_data(show_spinner=False)
+# cache_resource (not cache_data): every caller shares the one frame,
+# so the STR-tree built lazily on .sindex survives across clicks instead
+# of being rebuilt on each rerun's copy. Callers only read/merge.
+@st.cache_resource(show_spinner=False)
 def load_county_geoms() -> gpd.GeoDataFrame:
+    # Simplified WGS84 result is persisted as GeoParquet: warm starts
+    # skip the shapefile parse, reprojection and simplify entirely
+    pq = TIGER_COUNTY_CACHE_DIR / "counties_wgs84_simpl.parquet"
+    if pq.exists():
+        return gpd.read_parquet(pq)
+
     shp = _ensure_tiger_counties()
-    gdf = gpd.read_file(shp)
+    gdf = gpd.read_file(shp, engine="pyogrio")
     # GEOID as 5-char string
     gdf["GEOID"] = gdf["GEOID"].astype(str).str.zfill(5)
     if gdf.crs is None:
@@ -36,7 +59,12 @@ def load_county_geoms() -> gpd.GeoDataFrame:
     gdf = gdf.to_crs("EPSG:4326")
     # Simplify for web map speed
     gdf["geometry"] = gdf.geometry.simplify(0.01, preserve_topology=True)
-    return gdf[["GEOID","NAME","STATEFP","geometry"]].copy()
+    gdf = gdf[["GEOID","NAME","STATEFP","geometry"]].copy()
+    try:
+        gdf.to_parquet(pq)
+    except Exception:
+        pass  # cache write is best-effort; the gdf is still usable
+    return gdf
 
 def render_county_map(fraud_df: pd.DataFrame | None, selected_geoid_key: str = "selected_geoid") -> None:
     gdf = load_county_geoms()
@@ -70,7 +98,10 @@ def render_county_map(fraud_df: pd.DataFrame | None, selected_geoid_key: str = "
     if state and state.get("last_clicked"):
         lat = state["last_clicked"]["lat"]
         lng = state["last_clicked"]["lng"]
-        pt = gpd.GeoDataFrame(geometry=[Point(lng, lat)], crs="EPSG:4326")
-        hit = gpd.sjoin(pt, gdf[["GEOID","geometry"]], how="left", predicate="within")
-        if not hit.empty and pd.notna(hit.iloc[0].get("GEOID")):
-            st.session_state[selected_geoid_key] = str(hit.iloc[0]["GEOID"])
+        # One STR-tree probe on the cached spatial index instead of a
+        # single-point GeoDataFrame + full sjoin per click
+        idxs = gdf.sindex.query(Point(lng, lat), predicate="within")
+        if len(idxs):
+            geoid = gdf["GEOID"].iat[int(idxs[0])]
+            if pd.notna(geoid):
+                st.session_state[selected_geoid_key] = str(geoid)
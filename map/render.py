@@ -13,6 +13,7 @@ Features:
 """
 
 import duckdb
+import numpy as np
 import pandas as pd
 import streamlit as st
 import pydeck as pdk
@@ -128,45 +129,52 @@ con.execute(
         """Simple 3-stop scale: low, mid, high → RGB."""
         s = series.fillna(0.0)
         if s.empty:
-            return [[180, 180, 180]] * len(s)
-
-        q10 = float(s.quantile(0.10))
-        q50 = float(s.quantile(0.50))
-        q90 = float(s.quantile(0.90))
-
-        colors = []
-        for v in s:
-            if v <= q10:
-                c = (0, 120, 255)    # low
-            elif v <= q50:
-                c = (80, 200, 120)   # mid
-            else:
-                c = (230, 80, 60)    # high
-
-            if invert:
-                c = (c[2], c[1], c[0])
-
-            colors.append(list(c))
-        return colors
-
-    if mode == "PPP intensity (risk score)":
-        # Use tier-like intensity based on risk_score; fallback to loan_total
-        series = df["risk_score"]
-        if series.max() == 0:
-            series = df["loan_total"]
-        df["color"] = _color_scale(series, invert=False)
-
-    elif mode == "Population":
-        df["color"] = _color_scale(df["Total_Pop"], invert=False)
-
-    elif mode == "Median income":
-        df["color"] = _color_scale(df["Median_Income"], invert=False)
-
-    else:  # Poverty rate
-        df["color"] = _color_scale(df["Poverty_Rate"], invert=False)
+            return []
+
+        # Bucket every value in one vectorized pass and index into the
+        # three-stop palette — no per-row Python loop
+        v = s.to_numpy(dtype="float64")
+        q10, q50 = np.quantile(v, [0.10, 0.50])
+        stops = np.array(
+            [[0, 120, 255],    # low
+             [80, 200, 120],   # mid
+             [230, 80, 60]],   # high
+            dtype=np.uint8,
+        )
+        if invert:
+            stops = stops[:, ::-1]
+        idx = np.where(v <= q10, 0, np.where(v <= q50, 1, 2))
+        return stops[idx].tolist()
+
+    # Color/size only depend on the mode and the loaded frame, so
+    # style-only reruns reuse the computed columns from session state.
+    # The key carries a content fingerprint (row count + column sum):
+    # the county frame's length barely moves across data refreshes, so
+    # length alone would keep serving stale styling after a rebuild.
+    metric = {
+        "PPP intensity (risk score)": "risk_score",
+        "Population": "Total_Pop",
+        "Median income": "Median_Income",
+        "Poverty rate": "Poverty_Rate",
+    }[mode]
+
+    series = df[metric]
+    if metric == "risk_score" and series.max() == 0:
+        # Fallback to loan_total when scores are all zero
+        series = df["loan_total"]
+    color_key = (
+        "render_map_color", metric, len(df), float(series.fillna(0.0).sum())
+    )
+    if color_key not in st.session_state:
+        st.session_state[color_key] = _color_scale(series, invert=False)
+    df["color"] = st.session_state[color_key]
 
     # Dot size driven by loan_count (capped for readability)
-    df["size"] = (df["loan_count"].astype("float64") ** 0.7).clip(lower=5, upper=90)
+    counts = df["loan_count"].astype("float64")
+    size_key = ("render_map_size", len(df), float(counts.fillna(0.0).sum()))
+    if size_key not in st.session_state:
+        st.session_state[size_key] = (counts ** 0.7).clip(lower=5, upper=90)
+    df["size"] = st.session_state[size_key]
 
     # ------------------------------------------------------------------
     # Deck.gl layer
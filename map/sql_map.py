@@ -4,14 +4,13 @@
 
 MAP_FRAME_QUERY = """
 WITH ppp AS (
+    -- ppp_by_geoid already resolved name+state to the county key at
+    -- ingest, so the map joins on GEOID instead of two string columns
     SELECT
-        county_norm,
-        borrowerstate_u,
-        COUNT(*)::INT AS loan_count
-    FROM ppp_clean
-    WHERE county_norm IS NOT NULL
-      AND borrowerstate_u IS NOT NULL
-    GROUP BY 1,2
+        GEOID,
+        loan_count::INT AS loan_count
+    FROM ppp_by_geoid
+    WHERE GEOID IS NOT NULL
 ),
 
 county AS (
@@ -38,38 +37,49 @@ acs AS (
     FROM acs_county
 )
 
-SELECT
-    -- Identity
-    c.GEOID,
-    c.STUSPS,
-    c.NAME,
-    c.NAME_NORM,
+, frame AS (
+    SELECT
+        -- Identity
+        c.GEOID,
+        c.STUSPS,
+        c.NAME,
+        c.NAME_NORM,
 
-    -- Centroids
-    c.lat,
-    c.lon,
+        -- Centroids
+        c.lat,
+        c.lon,
 
-    -- ACS
-    a.Total_Pop,
-    a.Median_Income,
-    a.Poverty_Rate,
-    a.Unemployment_Rate,
+        -- ACS
+        a.Total_Pop,
+        a.Median_Income,
+        a.Poverty_Rate,
+        a.Unemployment_Rate,
 
-    -- PPP
-    p.loan_count,
+        -- PPP
+        p.loan_count,
 
-    -- Derived fields
-    CASE WHEN a.Total_Pop > 0
-         THEN p.loan_count / a.Total_Pop::DOUBLE
-         ELSE NULL END AS loans_per_capita
+        -- Derived fields
+        CASE WHEN a.Total_Pop > 0
+             THEN p.loan_count / a.Total_Pop::DOUBLE
+             ELSE NULL END AS loans_per_capita
 
-FROM county AS c
-LEFT JOIN acs AS a
-    ON a.GEOID = c.GEOID
-LEFT JOIN ppp AS p
-    ON upper(trim(c.NAME_NORM)) = upper(trim(p.county_norm))
-   AND upper(trim(c.STUSPS)) = upper(trim(p.borrowerstate_u))
-WHERE c.lat IS NOT NULL
-  AND c.lon IS NOT NULL
-ORDER BY p.loan_count DESC NULLS LAST;
+    FROM county AS c
+    LEFT JOIN acs AS a
+        ON a.GEOID = c.GEOID
+    LEFT JOIN ppp AS p
+        ON p.GEOID = c.GEOID
+    WHERE c.lat IS NOT NULL
+      AND c.lon IS NOT NULL
+)
+
+SELECT
+    *,
+    -- Tercile color bins per overlay metric, computed here so the
+    -- renderer just picks a bin column — no per-row Python coloring
+    NTILE(3) OVER (ORDER BY loan_count    NULLS FIRST) AS bin_ppp,
+    NTILE(3) OVER (ORDER BY Total_Pop     NULLS FIRST) AS bin_pop,
+    NTILE(3) OVER (ORDER BY Median_Income NULLS FIRST) AS bin_income,
+    NTILE(3) OVER (ORDER BY Poverty_Rate  NULLS FIRST) AS bin_poverty
+FROM frame
+ORDER BY loan_count DESC NULLS LAST;
 """
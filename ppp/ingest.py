@@ -30,6 +30,8 @@ from typing import Generator, Tuple
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 PPP_EXPECTED_COLS = [
@@ -105,8 +107,9 @@ def _normalize_column_name(col: str) -> str:
 def _normalize_chunk(df: pd.DataFrame) -> pd.DataFrame:
     """Normalize a raw PPP DataFrame chunk into the canonical schema."""
 
-    # 1) Normalize column names
-    df = df.copy()
+    # 1) Normalize column names. The chunk comes straight off the CSV
+    # iterator and is owned by the ingest loop, so mutate it in place —
+    # no defensive full-frame copy (~55 string columns per 200k rows).
     df.columns = [_normalize_column_name(c) for c in df.columns]
 
     # 2) Ensure required base columns exist (fill missing with empty string)
@@ -114,29 +117,30 @@ def _normalize_chunk(df: pd.DataFrame) -> pd.DataFrame:
         if col not in df.columns and col not in ("borrowerstate_u", "county_norm"):
             df[col] = ""
 
-    # 3) Build borrowerstate_u
+    # 3) Build borrowerstate_u (Arrow kernels: one C pass per op instead
+    # of pandas object-dtype string copies)
     if "borrowerstate" in df.columns:
-        df["borrowerstate_u"] = (
-            df["borrowerstate"].fillna("").astype(str).str.strip().str.upper()
-        )
+        arr = pa.array(df["borrowerstate"].fillna("").astype(str), type=pa.string())
+        df["borrowerstate_u"] = pc.utf8_upper(
+            pc.utf8_trim_whitespace(arr)
+        ).to_numpy(zero_copy_only=False)
     else:
         df["borrowerstate_u"] = ""
 
     # 4) Build county_norm from projectcountyname
-    import re
-
     if "projectcountyname" in df.columns:
-        c = df["projectcountyname"].fillna("").astype(str).str.upper().str.strip()
+        c = pa.array(df["projectcountyname"].fillna("").astype(str), type=pa.string())
+        c = pc.utf8_trim_whitespace(pc.utf8_upper(c))
 
         # Remove common suffixes
-        for suffix in [" COUNTY", " PARISH", " BOROUGH", " MUNICIPALITY", " CITY"]:
-            c = c.str.replace(suffix, "", regex=False)
+        for suffix in (" COUNTY", " PARISH", " BOROUGH", " MUNICIPALITY", " CITY"):
+            c = pc.replace_substring(c, suffix, "")
 
-        # Remove non-letter/space
-        c = c.str.replace(r"[^A-Z ]", "", regex=True)
-        c = c.str.replace(r"\s+", " ", regex=True).str.strip()
+        # Remove non-letter/space, collapse whitespace
+        c = pc.replace_substring_regex(c, "[^A-Z ]", "")
+        c = pc.utf8_trim_whitespace(pc.replace_substring_regex(c, r"\s+", " "))
 
-        df["county_norm"] = c
+        df["county_norm"] = c.to_numpy(zero_copy_only=False)
     else:
         df["county_norm"] = ""
 
@@ -147,10 +151,71 @@ def _normalize_chunk(df: pd.DataFrame) -> pd.DataFrame:
         for col in missing_core:
             df[col] = ""
 
+    # Copy-on-write makes this selection lazy — no second materialization
     df = df[PPP_EXPECTED_COLS]
     return df
 
 
+def _ingest_file_native(
+    con: duckdb.DuckDBPyConnection, file_str: str, create_table: bool
+) -> int:
+    """
+    Ingest a whole CSV through DuckDB's parallel reader.
+
+    Mirrors _normalize_chunk in SQL (header normalization, missing
+    columns as '', borrowerstate_u, county_norm) so the result is
+    byte-identical to the pandas path, but parses multi-threaded in C++
+    with no per-chunk pandas frame or register round trip. Raises on
+    any failure; the caller falls back to the chunked reader.
+    """
+    cols = [
+        d[0]
+        for d in con.execute(
+            "SELECT * FROM read_csv(?, header=true, all_varchar=true, "
+            "encoding='latin-1') LIMIT 0",
+            [file_str],
+        ).description
+    ]
+    by_norm: dict[str, str] = {}
+    for c in cols:
+        by_norm.setdefault(_normalize_column_name(c), c)
+
+    exprs = []
+    for col in PPP_EXPECTED_COLS:
+        if col in ("borrowerstate_u", "county_norm"):
+            continue
+        raw = by_norm.get(col)
+        exprs.append(f'"{raw}" AS {col}' if raw is not None else f"'' AS {col}")
+
+    state_src = (
+        f'"{by_norm["borrowerstate"]}"' if "borrowerstate" in by_norm else "''"
+    )
+    exprs.append(f"upper(trim(COALESCE({state_src}, ''))) AS borrowerstate_u")
+
+    if "projectcountyname" in by_norm:
+        county = f'upper(trim(COALESCE("{by_norm["projectcountyname"]}", \'\')))'
+        for suffix in (" COUNTY", " PARISH", " BOROUGH", " MUNICIPALITY", " CITY"):
+            county = f"replace({county}, '{suffix}', '')"
+        county = (
+            f"trim(regexp_replace(regexp_replace({county}, '[^A-Z ]', '', 'g'), "
+            f"'\\s+', ' ', 'g'))"
+        )
+    else:
+        county = "''"
+    exprs.append(f"{county} AS county_norm")
+
+    select = (
+        f"SELECT {', '.join(exprs)} FROM read_csv(?, header=true, "
+        "all_varchar=true, encoding='latin-1')"
+    )
+    if create_table:
+        con.execute("DROP TABLE IF EXISTS ppp_clean")
+        sql = f"CREATE TABLE ppp_clean AS {select}"
+    else:
+        sql = f"INSERT INTO ppp_clean {select}"
+    return int(con.execute(sql, [file_str]).fetchone()[0])
+
+
 def _create_or_replace_log_table(con: duckdb.DuckDBPyConnection) -> None:
     con.execute(
         """
@@ -182,6 +247,121 @@ def _append_log(
     )
 
 
+def refresh_ppp_county_match(con: duckdb.DuckDBPyConnection) -> None:
+    """
+    Materialize the ppp_clean × county_ref match once after ingest.
+
+    The alignment audit and county aggregation both need this join;
+    persisting it here turns their repeat scans into plain table reads.
+    Clustering by GEOID lets min-max zonemaps prune row groups on the
+    per-county lookups.
+    """
+    con.execute(
+        """
+        CREATE OR REPLACE TABLE ppp_county_match AS
+        SELECT
+            p.loannumber,
+            p.currentapprovalamount,
+            -- Typed once here; per-county consumers read the DOUBLE
+            -- columns instead of re-running TRY_CAST over the table
+            TRY_CAST(NULLIF(p.currentapprovalamount, '') AS DOUBLE)
+                AS currentapprovalamount_d,
+            TRY_CAST(NULLIF(p.jobsreported, '') AS DOUBLE) AS jobsreported_d,
+            p.servicinglendername,
+            p.borrowerstate_u,
+            p.county_norm,
+            r.GEOID,
+            r.STUSPS
+        FROM ppp_clean p
+        LEFT JOIN county_ref r
+          ON p.borrowerstate_u = r.STUSPS
+         AND p.county_norm = r.NAME_NORM
+        ORDER BY r.GEOID
+        """
+    )
+    con.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ppp_county_match_geoid "
+        "ON ppp_county_match(GEOID)"
+    )
+
+
+def refresh_ppp_by_geoid(con: duckdb.DuckDBPyConnection) -> None:
+    """
+    Roll ppp_county_match up to one row per GEOID (plus a NULL-GEOID
+    row for unmatched loans).
+
+    Render-time consumers (health-panel KPIs, top-county views) read
+    this county-sized table instead of re-aggregating the full PPP
+    table on every rerun.
+    """
+    con.execute(
+        """
+        CREATE OR REPLACE TABLE ppp_by_geoid AS
+        SELECT
+            GEOID,
+            COUNT(*) AS loan_count,
+            SUM(currentapprovalamount_d) AS total_approved
+        FROM ppp_county_match
+        GROUP BY GEOID
+        """
+    )
+
+
+def refresh_ppp_numeric(con: duckdb.DuckDBPyConnection) -> None:
+    """
+    Persist the TEXT→DOUBLE retype of the hot scoring columns once at
+    ingest time.
+
+    ppp_clean stores everything as TEXT; the fraud builders used to cast
+    the amount/jobs columns on every run. Materializing them here means
+    scoring passes scan 8-byte columnar doubles instead of re-parsing
+    strings. Clustering by the join keys keeps each state/county in few
+    row groups for zonemap pruning.
+    """
+    con.execute(
+        """
+        CREATE OR REPLACE TABLE ppp_clean_numeric AS
+        SELECT
+            COALESCE(
+                NULLIF(originatinglender, ''),
+                NULLIF(servicinglendername, '')
+            ) AS lender_name,
+            borrowerstate_u AS borrower_state,
+            county_norm,
+            COALESCE(
+                TRY_CAST(NULLIF(currentapprovalamount, '') AS DOUBLE),
+                TRY_CAST(NULLIF(initialapprovalamount, '') AS DOUBLE),
+                0
+            ) AS approval_amount,
+            COALESCE(TRY_CAST(NULLIF(jobsreported, '') AS DOUBLE), 0) AS jobs_reported
+        FROM ppp_clean
+        WHERE lender_name IS NOT NULL
+        ORDER BY borrower_state, county_norm
+        """
+    )
+    # Dictionary-encode the low-cardinality keys: enums store as small
+    # integers, so scoring group-bys and joins hash ints instead of
+    # variable-length strings. Safe here (unlike on ppp_clean, which is
+    # appended to) because this table and its types are rebuilt together
+    # on every ingest, so no unseen value can ever hit a stale enum.
+    for col, type_name in (
+        ("borrower_state", "ppp_state_enum"),
+        ("county_norm", "ppp_county_enum"),
+    ):
+        try:
+            con.execute(f"DROP TYPE IF EXISTS {type_name}")
+            con.execute(
+                f"CREATE TYPE {type_name} AS ENUM "
+                f"(SELECT DISTINCT {col} FROM ppp_clean_numeric "
+                f"WHERE {col} IS NOT NULL)"
+            )
+            con.execute(
+                f"ALTER TABLE ppp_clean_numeric ALTER COLUMN {col} TYPE {type_name}"
+            )
+        except duckdb.Error:
+            pass  # encoding is an optimization; VARCHAR behaves identically
+
+
 def ingest_ppp_directory(
     con: duckdb.DuckDBPyConnection,
     ppp_dir: str,
@@ -227,6 +407,26 @@ def ingest_ppp_directory(
         file_str = str(path)
         yield file_idx / total_files, f"Scanning PPP file {file_idx}/{total_files}: {file_str}"
 
+        # Fast path: whole-file ingest via DuckDB's parallel CSV reader.
+        # Any failure (odd encoding, malformed rows) falls back to the
+        # chunked pandas path below, which isolates errors per chunk.
+        try:
+            rows = _ingest_file_native(con, file_str, create_table=first_chunk_global)
+        except Exception as e:
+            yield file_idx / total_files, (
+                f"Native CSV ingest failed for {file_str} ({e}); "
+                "falling back to chunked reader"
+            )
+        else:
+            first_chunk_global = False
+            _append_log(con, file_str, 0, rows, "OK", None)
+            total_rows_inserted += rows
+            yield file_idx / total_files, (
+                f"Ingested {file_str} via DuckDB reader "
+                f"(rows={rows}, total_rows={total_rows_inserted})"
+            )
+            continue
+
         try:
             chunk_iter = pd.read_csv(
                 file_str,
@@ -315,6 +515,21 @@ def ingest_ppp_directory(
             "(all chunks failed or were empty). Check PPP column mappings."
         )
     else:
+        try:
+            refresh_ppp_county_match(con)
+            yield 1.0, "Materialized ppp_county_match from ppp_clean × county_ref"
+        except Exception as e:
+            yield 1.0, f"WARNING: could not materialize ppp_county_match: {e}"
+        try:
+            refresh_ppp_by_geoid(con)
+            yield 1.0, "Materialized ppp_by_geoid (per-county PPP rollup)"
+        except Exception as e:
+            yield 1.0, f"WARNING: could not materialize ppp_by_geoid: {e}"
+        try:
+            refresh_ppp_numeric(con)
+            yield 1.0, "Materialized ppp_clean_numeric (typed scoring columns)"
+        except Exception as e:
+            yield 1.0, f"WARNING: could not materialize ppp_clean_numeric: {e}"
         yield 1.0, f"PPP ingest completed successfully. Total rows inserted: {total_rows_inserted}"
 
 
@@ -33,6 +33,35 @@ def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
     return bool(con.execute(q, [name.lower()]).fetchone()[0])
 
 
+# Same column shape as ppp_county_match, joined live — serves
+# databases whose PPP predates the materialized match table.
+_PPP_MATCH_FALLBACK = """(
+    SELECT
+        p.servicinglendername,
+        TRY_CAST(NULLIF(p.currentapprovalamount, '') AS DOUBLE)
+            AS currentapprovalamount_d,
+        TRY_CAST(NULLIF(p.jobsreported, '') AS DOUBLE) AS jobsreported_d,
+        cr.GEOID
+    FROM ppp_clean p
+    LEFT JOIN county_ref cr
+      ON p.county_norm = cr.NAME_NORM
+     AND p.borrowerstate_u = cr.STUSPS
+)"""
+
+
+def _ppp_match_source(con: duckdb.DuckDBPyConnection) -> str | None:
+    """Materialized and populated ppp_county_match, else the live-join
+    fallback, else None when no PPP data exists."""
+    if (
+        _table_exists(con, "ppp_county_match")
+        and con.execute("SELECT COUNT(*) FROM ppp_county_match").fetchone()[0] > 0
+    ):
+        return "ppp_county_match"
+    if _table_exists(con, "ppp_clean") and _table_exists(con, "county_ref"):
+        return _PPP_MATCH_FALLBACK
+    return None
+
+
 def _safe_num(s: pd.Series | int | float, default: float = 0.0) -> float:
     try:
         if isinstance(s, pd.Series):
@@ -71,9 +100,9 @@ def _load_compare_rows(con: duckdb.DuckDBPyConnection, geoids: list[str]) -> pd.
         return pd.DataFrame()
 
     # PPP is optional for compare output, but if present we compute it.
-    has_ppp = _table_exists(con, "ppp_clean")
+    ppp_src = _ppp_match_source(con)
 
-    if has_ppp:
+    if ppp_src is not None:
         sql = f"""
         WITH target AS (
             SELECT GEOID, NAME, STUSPS
@@ -82,18 +111,15 @@ def _load_compare_rows(con: duckdb.DuckDBPyConnection, geoids: list[str]) -> pd.
         ),
         ppp_sum AS (
             SELECT
-                cr.GEOID,
+                m.GEOID,
                 COUNT(*) AS loan_count,
-                SUM(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS total_approved,
-                AVG(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS avg_loan,
-                SUM(TRY_CAST(p.jobsreported AS DOUBLE)) AS jobs_reported
-            FROM ppp_clean p
-            JOIN county_ref cr
-              ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-             AND p.borrowerstate = cr.STUSPS
+                SUM(m.currentapprovalamount_d) AS total_approved,
+                AVG(m.currentapprovalamount_d) AS avg_loan,
+                SUM(m.jobsreported_d) AS jobs_reported
+            FROM {ppp_src} m
             JOIN target t
-              ON cr.GEOID = t.GEOID
-            GROUP BY cr.GEOID
+              ON m.GEOID = t.GEOID
+            GROUP BY m.GEOID
         )
         SELECT
             t.GEOID,
@@ -144,7 +170,8 @@ def _load_lender_concentration(con: duckdb.DuckDBPyConnection, geoids: list[str]
     """
     if not geoids:
         return pd.DataFrame()
-    if not (_table_exists(con, "ppp_clean") and _table_exists(con, "county_ref")):
+    ppp_src = _ppp_match_source(con)
+    if ppp_src is None or not _table_exists(con, "county_ref"):
         return pd.DataFrame()
 
     sql = f"""
@@ -155,17 +182,14 @@ def _load_lender_concentration(con: duckdb.DuckDBPyConnection, geoids: list[str]
     ),
     lender_totals AS (
         SELECT
-            cr.GEOID,
-            p.servicinglendername AS lender,
-            SUM(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS total_approved
-        FROM ppp_clean p
-        JOIN county_ref cr
-          ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-         AND p.borrowerstate = cr.STUSPS
+            m.GEOID,
+            m.servicinglendername AS lender,
+            SUM(m.currentapprovalamount_d) AS total_approved
+        FROM {ppp_src} m
         JOIN target t
-          ON cr.GEOID = t.GEOID
-        WHERE p.servicinglendername IS NOT NULL
-        GROUP BY cr.GEOID, p.servicinglendername
+          ON m.GEOID = t.GEOID
+        WHERE m.servicinglendername IS NOT NULL
+        GROUP BY m.GEOID, m.servicinglendername
     ),
     ranked AS (
         SELECT
@@ -33,6 +33,37 @@ def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
     return bool(con.execute(q, [name.lower()]).fetchone()[0])
 
 
+# Live-join fallback with the same column shape as ppp_county_match,
+# for databases ingested before the match table existed (until their
+# next ingest materializes it).
+_PPP_MATCH_FALLBACK = """(
+    SELECT
+        p.servicinglendername,
+        TRY_CAST(NULLIF(p.currentapprovalamount, '') AS DOUBLE)
+            AS currentapprovalamount_d,
+        TRY_CAST(NULLIF(p.jobsreported, '') AS DOUBLE) AS jobsreported_d,
+        cr.GEOID
+    FROM ppp_clean p
+    LEFT JOIN county_ref cr
+      ON p.county_norm = cr.NAME_NORM
+     AND p.borrowerstate_u = cr.STUSPS
+)"""
+
+
+def _ppp_match_source(con: duckdb.DuckDBPyConnection) -> str | None:
+    """FROM-source for PPP-per-county reads: the materialized match
+    table when it exists and is populated, else the live join, else
+    None (no PPP data at all — callers fail closed)."""
+    if (
+        _table_exists(con, "ppp_county_match")
+        and con.execute("SELECT COUNT(*) FROM ppp_county_match").fetchone()[0] > 0
+    ):
+        return "ppp_county_match"
+    if _table_exists(con, "ppp_clean") and _table_exists(con, "county_ref"):
+        return _PPP_MATCH_FALLBACK
+    return None
+
+
 # ---------------------------------------------------------------------
 # Data loaders
 # ---------------------------------------------------------------------
@@ -69,41 +100,39 @@ def _load_county_risk(con: duckdb.DuckDBPyConnection, geoid: str) -> pd.Series |
 
 
 def _load_ppp_summary(con: duckdb.DuckDBPyConnection, geoid: str) -> pd.Series | None:
-    if not (_table_exists(con, "ppp_clean") and _table_exists(con, "county_ref")):
+    src = _ppp_match_source(con)
+    if src is None:
         return None
 
-    sql = """
+    # ppp_county_match is GEOID-keyed and carries the ingest-typed
+    # DOUBLE columns, so no join and no per-row TRY_CAST here
+    sql = f"""
     SELECT
         COUNT(*) AS loan_count,
-        SUM(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS total_approved,
-        AVG(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS avg_loan,
-        SUM(TRY_CAST(p.jobsreported AS DOUBLE)) AS jobs_reported
-    FROM ppp_clean p
-    JOIN county_ref cr
-      ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-     AND p.borrowerstate = cr.STUSPS
-    WHERE cr.GEOID = ?
+        SUM(m.currentapprovalamount_d) AS total_approved,
+        AVG(m.currentapprovalamount_d) AS avg_loan,
+        SUM(m.jobsreported_d) AS jobs_reported
+    FROM {src} m
+    WHERE m.GEOID = ?
     """
     df = con.execute(sql, [geoid]).fetchdf()
     return df.iloc[0] if not df.empty else None
 
 
 def _load_top_lenders(con: duckdb.DuckDBPyConnection, geoid: str, limit: int = 10) -> pd.DataFrame:
-    if not (_table_exists(con, "ppp_clean") and _table_exists(con, "county_ref")):
+    src = _ppp_match_source(con)
+    if src is None:
         return pd.DataFrame()
 
-    sql = """
+    sql = f"""
     SELECT
-        p.servicinglendername AS lender,
+        m.servicinglendername AS lender,
         COUNT(*) AS loan_count,
-        SUM(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS total_approved
-    FROM ppp_clean p
-    JOIN county_ref cr
-      ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-     AND p.borrowerstate = cr.STUSPS
-    WHERE cr.GEOID = ?
-      AND p.servicinglendername IS NOT NULL
-    GROUP BY p.servicinglendername
+        SUM(m.currentapprovalamount_d) AS total_approved
+    FROM {src} m
+    WHERE m.GEOID = ?
+      AND m.servicinglendername IS NOT NULL
+    GROUP BY m.servicinglendername
     ORDER BY total_approved DESC NULLS LAST
     LIMIT ?
     """
@@ -125,8 +154,8 @@ def _load_borrowers(con: duckdb.DuckDBPyConnection, geoid: str, limit: int = 50)
         TRY_CAST(p.jobsreported AS DOUBLE) AS jobsreported
     FROM ppp_clean p
     JOIN county_ref cr
-      ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-     AND p.borrowerstate = cr.STUSPS
+      ON p.county_norm = cr.NAME_NORM
+     AND p.borrowerstate_u = cr.STUSPS
     WHERE cr.GEOID = ?
     ORDER BY currentapprovalamount DESC NULLS LAST
     LIMIT ?
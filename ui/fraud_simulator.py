@@ -30,6 +30,34 @@ def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
     return bool(con.execute(q, [name.lower()]).fetchone()[0])
 
 
+# Fallback with ppp_county_match's column shape for databases whose
+# PPP was ingested before the match table was introduced.
+_PPP_MATCH_FALLBACK = """(
+    SELECT
+        p.servicinglendername,
+        TRY_CAST(NULLIF(p.currentapprovalamount, '') AS DOUBLE)
+            AS currentapprovalamount_d,
+        cr.GEOID
+    FROM ppp_clean p
+    LEFT JOIN county_ref cr
+      ON p.county_norm = cr.NAME_NORM
+     AND p.borrowerstate_u = cr.STUSPS
+)"""
+
+
+def _ppp_match_source(con: duckdb.DuckDBPyConnection) -> str | None:
+    """Materialized and populated ppp_county_match, else the live-join
+    fallback, else None when no PPP data exists."""
+    if (
+        _table_exists(con, "ppp_county_match")
+        and con.execute("SELECT COUNT(*) FROM ppp_county_match").fetchone()[0] > 0
+    ):
+        return "ppp_county_match"
+    if _table_exists(con, "ppp_clean") and _table_exists(con, "county_ref"):
+        return _PPP_MATCH_FALLBACK
+    return None
+
+
 # ---------------------------------------------------------------------
 # Data loaders
 # ---------------------------------------------------------------------
@@ -46,20 +74,18 @@ def _load_county_universe(con: duckdb.DuckDBPyConnection) -> pd.DataFrame:
 
 
 def _load_lender_totals(con: duckdb.DuckDBPyConnection, geoid: str) -> pd.DataFrame:
-    if not (_table_exists(con, "ppp_clean") and _table_exists(con, "county_ref")):
+    src = _ppp_match_source(con)
+    if src is None:
         return pd.DataFrame()
 
-    sql = """
+    sql = f"""
     SELECT
-        p.servicinglendername AS lender,
-        SUM(TRY_CAST(p.currentapprovalamount AS DOUBLE)) AS total_approved
-    FROM ppp_clean p
-    JOIN county_ref cr
-      ON UPPER(TRIM(p.county_norm)) = UPPER(TRIM(cr.NAME))
-     AND p.borrowerstate = cr.STUSPS
-    WHERE cr.GEOID = ?
-      AND p.servicinglendername IS NOT NULL
-    GROUP BY p.servicinglendername
+        m.servicinglendername AS lender,
+        SUM(m.currentapprovalamount_d) AS total_approved
+    FROM {src} m
+    WHERE m.GEOID = ?
+      AND m.servicinglendername IS NOT NULL
+    GROUP BY m.servicinglendername
     ORDER BY total_approved DESC NULLS LAST
     """
     return con.execute(sql, [geoid]).fetchdf()
@@ -107,6 +107,13 @@ def _load_ops_frame(con: duckdb.DuckDBPyConnection, use_peer_norm: bool) -> pd.D
     if "hidden_signal_score" not in df.columns:
         df["hidden_signal_score"] = 0.0
 
+    # Tier/state columns repeat a handful of values across ~3k rows;
+    # dictionary encoding keeps them as small codes through the Arrow
+    # serialization to the browser instead of one string per row
+    for c in ["risk_tier", "outlier_tier", "hidden_signal_tier", "STUSPS"]:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+
     return df
 
 
@@ -11,41 +11,35 @@ import duckdb
 # Helpers
 # ---------------------------------------------------------------------
 
+# All six pipeline flags in one round trip instead of a catalog query
+# per badge.
+_PIPELINE_FLAGS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM duckdb_tables()
+         WHERE lower(table_name) = 'county_ref') > 0,
+        (SELECT COUNT(*) FROM duckdb_columns()
+         WHERE lower(table_name) = 'county_ref'
+           AND lower(column_name) = 'intptlat') > 0,
+        (SELECT COUNT(*) FROM duckdb_tables()
+         WHERE lower(table_name) = 'ppp_clean') > 0,
+        (SELECT COUNT(*) FROM duckdb_tables()
+         WHERE lower(table_name) = 'county_agg') > 0,
+        (SELECT COUNT(*) FROM duckdb_tables()
+         WHERE lower(table_name) = 'acs_county') > 0,
+        (SELECT COUNT(*) FROM duckdb_tables()
+         WHERE lower(table_name) = 'county_scores') > 0
+"""
+
+
 def _table_exists(con: duckdb.DuckDBPyConnection, name: str) -> bool:
     q = f"""
-        SELECT COUNT(*) 
+        SELECT COUNT(*)
         FROM duckdb_tables()
         WHERE lower(table_name) = lower('{name}')
     """
     return con.execute(q).fetchone()[0] > 0
 
 
-def _has_centroids(con):
-    q = """
-        SELECT COUNT(*)
-        FROM duckdb_columns()
-        WHERE lower(table_name) = 'county_ref'
-          AND lower(column_name) = 'intptlat'
-    """
-    return con.execute(q).fetchone()[0] > 0
-
-
-def _has_ppp(con):
-    return _table_exists(con, "ppp_clean")
-
-
-def _has_ppp_agg(con):
-    return _table_exists(con, "county_agg")
-
-
-def _has_acs(con):
-    return _table_exists(con, "acs_county")
-
-
-def _has_scores(con):
-    return _table_exists(con, "county_scores")
-
-
 # ---------------------------------------------------------------------
 # Main renderer
 # ---------------------------------------------------------------------
@@ -53,13 +47,15 @@ def _has_scores(con):
 def render_pipeline_status(con):
     st.subheader("Pipeline Health")
 
+    flags = con.execute(_PIPELINE_FLAGS_SQL).fetchone()
+
     rows = [
-        ("County Reference Loaded", _table_exists(con, "county_ref")),
-        ("Centroids Present", _has_centroids(con)),
-        ("PPP Raw → ppp_clean", _has_ppp(con)),
-        ("PPP Aggregation → county_agg", _has_ppp_agg(con)),
-        ("ACS Enriched → acs_county", _has_acs(con)),
-        ("Risk Scoring → county_scores", _has_scores(con)),
+        ("County Reference Loaded", flags[0]),
+        ("Centroids Present", flags[1]),
+        ("PPP Raw → ppp_clean", flags[2]),
+        ("PPP Aggregation → county_agg", flags[3]),
+        ("ACS Enriched → acs_county", flags[4]),
+        ("Risk Scoring → county_scores", flags[5]),
     ]
 
     for label, ok in rows: